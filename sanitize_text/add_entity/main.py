@@ -22,6 +22,7 @@ Examples:
 """
 
 import json
+from bisect import bisect_left
 from collections.abc import Callable
 from pathlib import Path
 
@@ -69,8 +70,8 @@ class EntityManager:
             List of dictionaries containing entity data
         """
         try:
-            with open(file_path, encoding="utf-8") as json_file:
-                return json.load(json_file)
+            # json.loads accepts UTF-8 bytes directly, skipping the text-mode decoder
+            return json.loads(Path(file_path).read_bytes())
         except FileNotFoundError:
             self._stderr(f"Error: File {file_path} not found.")
             return []
@@ -118,27 +119,69 @@ class EntityManager:
 
         file_path = self.files[entity_type]
         entities = self.load_json(file_path)
+        keys = self._sorted_keys(entities)
 
-        new_entry = {
-            "match": value,
-            "filth_type": "location" if entity_type == "city" else entity_type,
-        }
+        if not self._insert_entity(entities, keys, entity_type, value):
+            return False
+
+        if self.save_json(file_path, entities):
+            self._stdout(f"Successfully added {entity_type} '{value}'")
+            return True
+        return False
+
+    @staticmethod
+    def _sorted_keys(entities: list[dict[str, str]]) -> list[str]:
+        """Return the lowercased match keys, sorting ``entities`` if needed.
+
+        Args:
+            entities: Entity entries as loaded from a JSON file; sorted in place
+                when out of order.
+
+        Returns:
+            list[str]: Lowercased ``match`` values in the same order as ``entities``.
+        """
+        keys = [entity["match"].lower() for entity in entities]
+        # Files written by this tool are already in order; only hand-edited
+        # files need the full sort before binary searching them.
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            entities.sort(key=lambda x: x["match"].lower())
+            keys.sort()
+        return keys
+
+    def _insert_entity(
+        self,
+        entities: list[dict[str, str]],
+        keys: list[str],
+        entity_type: str,
+        value: str,
+    ) -> bool:
+        """Insert ``value`` at its alphabetical position unless already present.
+
+        Args:
+            entities: Sorted entity entries; updated in place.
+            keys: Lowercased keys matching ``entities``; updated in place.
+            entity_type: Type of entity being added.
+            value: The entity value to add.
 
+        Returns:
+            bool: True if the entry was inserted, False for a duplicate.
+        """
         # Check for existing entries (case-insensitive)
-        if any(entity["match"].lower() == value.lower() for entity in entities):
+        key = value.lower()
+        idx = bisect_left(keys, key)
+        if idx < len(keys) and keys[idx] == key:
             self._stderr(
                 f"Warning: {entity_type.capitalize()} '{value}' already exists",
             )
             return False
 
-        # Add new entry and maintain alphabetical order
-        entities.append(new_entry)
-        entities.sort(key=lambda x: x["match"].lower())
-
-        if self.save_json(file_path, entities):
-            self._stdout(f"Successfully added {entity_type} '{value}'")
-            return True
-        return False
+        new_entry = {
+            "match": value,
+            "filth_type": "location" if entity_type == "city" else entity_type,
+        }
+        keys.insert(idx, key)
+        entities.insert(idx, new_entry)
+        return True
 
 
 @click.command(context_settings=CONTEXT_SETTINGS)
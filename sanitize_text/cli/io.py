@@ -12,9 +12,18 @@ from pathlib import Path
 from sanitize_text.output import get_writer
 from sanitize_text.utils import preconvert
 from sanitize_text.utils.cleanup import cleanup_output
-from sanitize_text.utils.io_helpers import read_file_to_text
+from sanitize_text.utils.io_helpers import decode_text_bytes, read_file_to_text
 from sanitize_text.utils.normalize import normalize_pdf_text
 
+#: Output format inferred from the ``--output`` extension; anything else is txt.
+_OUTPUT_FORMATS_BY_EXTENSION = {
+    ".doc": "docx",
+    ".docx": "docx",
+    ".pdf": "pdf",
+    ".md": "md",
+    ".markdown": "md",
+}
+
 
 def read_input_source(
     *,
@@ -44,7 +53,7 @@ def read_input_source(
         raise ValueError("--append requires --output to be specified")
 
     if append and output_path and os.path.exists(output_path):
-        return Path(output_path).read_text(encoding="utf-8", errors="replace")
+        return decode_text_bytes(Path(output_path).read_bytes())
 
     if input_path:
         return read_file_to_text(
@@ -62,6 +71,11 @@ def read_input_source(
         import sys
 
         if not sys.stdin.isatty():
+            # Read raw bytes and decode once, bypassing the incremental text
+            # decoder; invalid bytes and newlines are handled as for files.
+            buffer = getattr(sys.stdin, "buffer", None)
+            if buffer is not None:
+                return decode_text_bytes(buffer.read())
             return sys.stdin.read()
     except Exception:  # pragma: no cover
         pass
@@ -83,14 +97,8 @@ def infer_output_format(output: str | None, explicit_format: str | None) -> str:
         return explicit_format
     if output is None:
         return "txt"
-    ext = Path(output).suffix.lower()
-    if ext in {".doc", ".docx"}:
-        return "docx"
-    if ext == ".pdf":
-        return "pdf"
-    if ext in {".md", ".markdown"}:
-        return "md"
-    return "txt"
+    ext = os.path.splitext(output)[1].lower()
+    return _OUTPUT_FORMATS_BY_EXTENSION.get(ext, "txt")
 
 
 def maybe_cleanup(text: str, enabled: bool) -> str:
@@ -129,9 +137,9 @@ def write_output(
         str: Final path containing the written artifact.
     """
     if output is None:
-        output_dir = Path.cwd() / "output"
-        output_dir.mkdir(exist_ok=True)
-        output = str(output_dir / "scrubbed.txt")
+        output_dir = os.path.join(os.getcwd(), "output")
+        os.makedirs(output_dir, exist_ok=True)
+        output = os.path.join(output_dir, "scrubbed.txt")
 
     writer = get_writer(fmt)
     write_kwargs: dict[str, object] = {}
@@ -21,9 +21,9 @@ Examples:
 """
 
 import sys
+from typing import Any
 
 import click
-from halo import Halo
 
 from sanitize_text.cli.io import (
     infer_output_format,
@@ -41,6 +41,31 @@ from sanitize_text.utils.nlp_resources import download_optional_models
 # Define custom context settings
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
+#: Spinner class, imported on first use so ``--help``, ``--list-detectors`` and
+#: ``--verbose`` runs do not pay for loading halo and its terminal helpers.
+Halo: Any = None
+
+#: Inputs shorter than this scrub too quickly for a spinner to be worth its
+#: thread and terminal redraws.
+_SPINNER_MIN_CHARS = 4096
+
+
+def _start_spinner(text: str) -> Any:
+    """Create and start a Halo spinner, importing halo on first use.
+
+    Args:
+        text: Message shown next to the spinner.
+
+    Returns:
+        Any: The running spinner instance.
+    """
+    global Halo
+    if Halo is None:
+        from halo import Halo
+    spinner = Halo(text=text, spinner="dots")
+    spinner.start()
+    return spinner
+
 
 def _print_detectors() -> None:
     """Print available detector descriptions to stdout.
@@ -94,6 +119,7 @@ def _run_scrub(
         selected_detectors,
         custom_text=custom,
         verbose=verbose,
+        include_filth=verbose,
     )
     locales_to_process = ["en_US", "nl_NL"] if locale is None else [locale]
 
@@ -108,40 +134,28 @@ def _run_scrub(
             scrubbed_text = "\n\n".join(outcome.texts.values())
     scrubbed_text = maybe_cleanup(scrubbed_text, cleanup)
 
-    failed_locales = [loc for loc in locales_to_process if loc not in outcome.texts]
-    failure_messages = {
-        failed: outcome.errors.get(failed, "Unknown error") for failed in failed_locales
-    }
-    if not verbose:
-        for failed, message in failure_messages.items():
-            click.echo(f"Warning: Processing failed for locale {failed}: {message}", err=True)
+    # Report per-locale progress and failures in a single pass.
+    for loc in locales_to_process:
+        succeeded = loc in outcome.texts
+        if not verbose:
+            if not succeeded:
+                message = outcome.errors.get(loc, "Unknown error")
+                click.echo(f"Warning: Processing failed for locale {loc}: {message}", err=True)
+            continue
+        click.echo(f"\n[Processing locale: {loc}]")
+        if succeeded:
+            detectors_for_locale = outcome.detectors.get(loc)
+            if detectors_for_locale:
+                click.echo(f"[Active detectors: {', '.join(detectors_for_locale)}]")
+            click.echo(f"[Scanning text ({len(input_text)} characters)...]")
+            click.echo(f"[Completed processing for {loc}]")
+        else:
+            message = outcome.errors.get(loc, "Unknown error")
+            click.echo(f"[Failed processing locale {loc}: {message}]", err=True)
 
     if verbose:
-        from sanitize_text.core.scrubber import collect_filth
-
-        for loc in locales_to_process:
-            detectors_for_locale = outcome.detectors.get(loc)
-            if loc in outcome.texts:
-                click.echo(f"\n[Processing locale: {loc}]")
-                if detectors_for_locale:
-                    click.echo(f"[Active detectors: {', '.join(detectors_for_locale)}]")
-                click.echo(f"[Scanning text ({len(input_text)} characters)...]")
-                click.echo(f"[Completed processing for {loc}]")
-            else:
-                message = failure_messages.get(loc, "Unknown error")
-                click.echo(f"\n[Processing locale: {loc}]")
-                click.echo(
-                    f"[Failed processing locale {loc}: {message}]",
-                    err=True,
-                )
-
-        filth_map = collect_filth(
-            input_text,
-            locale,
-            selected_detectors,
-            custom_text=custom,
-        )
-        for loc, filths in filth_map.items():
+        # The filth comes from the scrub pass itself (include_filth=verbose).
+        for loc, filths in (outcome.filth or {}).items():
             click.echo(f"\nFound PII for {loc}:")
             for f in filths:
                 replacement = getattr(f, "replacement_string", "")
@@ -348,11 +362,10 @@ def main(
     if verbose:
         click.echo(f"[Input resolved: {len(input_text)} characters]")
 
-    # Set up spinner (only if not verbose)
+    # Set up spinner (only if not verbose, for non-trivial input on a terminal)
     spinner = None
-    if not verbose:
-        spinner = Halo(text="Scrubbing PII", spinner="dots")
-        spinner.start()
+    if not verbose and len(input_text) >= _SPINNER_MIN_CHARS and sys.stdout.isatty():
+        spinner = _start_spinner("Scrubbing PII")
 
     if verbose:
         target_locales = locale if locale is not None else "en_US and nl_NL"
@@ -10,12 +10,14 @@ from __future__ import annotations
 
 import importlib.util as importlib_util
 import logging
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - for type hints only
     import scrubadub
+    from spacy.language import Language
 
 
 logger = logging.getLogger(__name__)
@@ -74,11 +76,14 @@ class ScrubOutcome:
         texts: Scrubbed text keyed by locale.
         detectors: Detector names executed for each locale.
         errors: Error messages keyed by locale for failed runs.
+        filth: Detected filth keyed by locale, with ``replacement_string``
+            populated. ``None`` unless requested via ``include_filth``.
     """
 
     texts: dict[str, str]
     detectors: dict[str, list[str]]
     errors: dict[str, str]
+    filth: dict[str, list[scrubadub.filth.Filth]] | None = None
 
 
 @dataclass(frozen=True)
@@ -109,8 +114,13 @@ class MultiLocaleResult:
     errors: dict[str, str]
 
 
+@lru_cache(maxsize=1)
 def _spacy_is_available() -> bool:
-    """Return ``True`` when ``scrubadub-spacy`` is importable."""
+    """Return ``True`` when ``scrubadub-spacy`` is importable.
+
+    The result is cached because the import machinery lookup would otherwise run
+    for every spec evaluation in every ``setup_scrubber`` call.
+    """
     try:
         return importlib_util.find_spec("scrubadub_spacy.detectors") is not None
     except ModuleNotFoundError:
@@ -212,13 +222,98 @@ _SPACY_MODELS = {
     "en_US": "en_core_web_sm",
 }
 
+#: Pipes ``scrubadub_spacy``'s ``SpacyEntityDetector`` selects for itself. Load-time
+#: pruning keeps them so the shared pipeline matches what the detector set up, and
+#: only components outside this set (attribute ruler, lemmatizer) are disabled.
+#: Entities do not need tagger or parser; ``_run_ner_only`` skips them per call.
+_SPACY_DETECTOR_PIPES = frozenset({"transformer", "tagger", "parser", "ner"})
+
+
+@lru_cache(maxsize=4)
+def _load_spacy_detector(
+    detector_cls: type[scrubadub.detectors.Detector], model: str, name: str
+) -> scrubadub.detectors.Detector:
+    """Construct a spaCy detector once per model and reuse it afterwards.
+
+    Loading a spaCy pipeline dominates the cost of building a scrubber, so the
+    detector (and the pipeline it holds) is shared across locale runs and
+    repeated ``setup_scrubber`` calls within the same process.
+
+    Args:
+        detector_cls: The ``SpacyEntityDetector`` class to instantiate.
+        model: Name of the spaCy model to load.
+        name: Detector name registered with the scrubber.
+
+    Returns:
+        scrubadub.detectors.Detector: The cached detector instance.
+    """
+    detector = detector_cls(model=model, name=name)
+    nlp = getattr(detector, "nlp", None)
+    if nlp is not None:
+        _prune_spacy_pipeline(nlp)
+        _run_ner_only(detector, nlp)
+    return detector
+
+
+def _prune_spacy_pipeline(nlp: Language) -> None:
+    """Disable pipeline components that the spaCy entity detector never enables.
+
+    ``scrubadub_spacy`` runs documents with only the transformer, tagger,
+    parser and ner pipes selected, so attribute rulers, lemmatizers and similar
+    components are pure overhead. The kept pipes and the entity output are
+    unchanged; embedding layers are kept when a kept pipe listens to them.
+
+    Args:
+        nlp: Loaded spaCy ``Language`` pipeline.
+    """
+    if "ner" not in nlp.pipe_names:
+        return
+    keep = {name for name in nlp.pipe_names if name in _SPACY_DETECTOR_PIPES}
+    for pipe_name in nlp.pipe_names:
+        listeners = getattr(nlp.get_pipe(pipe_name), "listening_components", ())
+        if keep.intersection(listeners):
+            keep.add(pipe_name)
+    for pipe_name in list(nlp.pipe_names):
+        if pipe_name not in keep:
+            nlp.disable_pipe(pipe_name)
+
+
+def _run_ner_only(detector: scrubadub.detectors.Detector, nlp: Language) -> None:
+    """Run ``detector``'s documents through ``ner`` alone.
+
+    The detector only reads ``doc.ents``. The tagger and parser it keeps
+    enabled do not feed the entity recognizer, so each detection run selects
+    ``ner`` (plus any embedding layer it listens to) and skips their forward
+    passes. ``select_pipes`` restores the shared pipeline after every call.
+
+    Args:
+        detector: The spaCy entity detector wrapping ``nlp``.
+        nlp: Loaded spaCy ``Language`` pipeline.
+    """
+    if "ner" not in nlp.pipe_names:
+        return
+    enable = [
+        pipe_name
+        for pipe_name in nlp.pipe_names
+        if pipe_name == "ner"
+        or "ner" in getattr(nlp.get_pipe(pipe_name), "listening_components", ())
+    ]
+    iter_filth_documents = detector.iter_filth_documents
+
+    def _iter_filth_documents(*args: object, **kwargs: object) -> Iterator[object]:
+        with nlp.select_pipes(enable=enable):
+            filths = list(iter_filth_documents(*args, **kwargs))
+        yield from filths
+
+    detector.iter_filth_documents = _iter_filth_documents
+
 
 def _build_spacy_detector(context: DetectorContext) -> scrubadub.detectors.Detector:
     from scrubadub_spacy.detectors import SpacyEntityDetector
 
     model = _SPACY_MODELS[context.locale]
     name = f"spacy_{context.locale.split('_')[0]}"
-    return SpacyEntityDetector(model=model, name=name)
+    return _load_spacy_detector(SpacyEntityDetector, model, name)
 
 
 def _spacy_enabled(context: DetectorContext) -> bool:
@@ -423,6 +518,7 @@ def setup_scrubber(
 
     from sanitize_text.utils.custom_detectors import CustomWordDetector
     from sanitize_text.utils.custom_detectors.base import DutchEntityDetector
+    from sanitize_text.utils.document_cache import DocumentCache
     from sanitize_text.utils.post_processors import DEFAULT_POST_PROCESSOR_FACTORY
 
     # Reset entity deduplication cache for new scrubber instance
@@ -477,12 +573,44 @@ def setup_scrubber(
 
     # Store verbose flag on scrubber and propagate to all detectors
     scrubber._verbose = verbose  # type: ignore[attr-defined]
+    # Detectors that declare a document cache share one per scrubber, so data
+    # derived from the document is released together with the scrubber.
+    document_cache = DocumentCache()
     for detector in detector_list:
         detector._verbose = verbose  # type: ignore[attr-defined]
+        if hasattr(detector, "_document_cache"):
+            detector._document_cache = document_cache  # type: ignore[attr-defined]
 
     return scrubber
 
 
+def _replace_filth(text: str, filths: Iterable[scrubadub.filth.Filth]) -> str:
+    """Return ``text`` with each filth span swapped for its replacement.
+
+    Mirrors ``scrubadub.Scrubber.clean`` for filth that was already produced by
+    ``Scrubber.iter_filth``, so callers needing both the filth list and the
+    scrubbed text do not have to run the detectors twice.
+
+    Args:
+        text: The original text the filth was detected in.
+        filths: Post-processed filth objects for ``text``.
+
+    Returns:
+        str: The scrubbed text.
+    """
+    chunks: list[str] = []
+    prev_end = 0
+    for filth in sorted(filths, key=lambda item: (item.beg, -item.end)):
+        if filth.beg < prev_end:
+            continue
+        chunks.append(text[prev_end : filth.beg])
+        replacement = filth.replacement_string
+        chunks.append(replacement if replacement is not None else filth.replace_with())
+        prev_end = filth.end
+    chunks.append(text[prev_end:])
+    return "".join(chunks)
+
+
 def run_multi_locale_scrub(
     *,
     text: str,
@@ -517,19 +645,15 @@ def run_multi_locale_scrub(
                 verbose=verbose,
                 post_processor_factory=post_processor_factory,
             )
-            scrubbed_text = scrubber.clean(text)
-            if cleanup and cleanup_func is not None:
-                scrubbed_text = cleanup_func(scrubbed_text)
-
             filths: list[scrubadub.filth.Filth] | None = None
             if include_filth:
-                filth_map = collect_filth(
-                    text,
-                    locale=current_locale,
-                    selected_detectors=detectors_for_locale,
-                    custom_text=custom_text,
-                )
-                filths = filth_map.get(current_locale, [])
+                # One detection pass serves both the scrubbed text and the filth list.
+                filths = list(scrubber.iter_filth(text))
+                scrubbed_text = _replace_filth(text, filths)
+            else:
+                scrubbed_text = scrubber.clean(text)
+            if cleanup and cleanup_func is not None:
+                scrubbed_text = cleanup_func(scrubbed_text)
 
             results.append(
                 LocaleResult(
@@ -545,12 +669,36 @@ def run_multi_locale_scrub(
     return MultiLocaleResult(results=results, errors=errors)
 
 
+def _scrub_single_locale(
+    text: str,
+    locale: str,
+    selected_detectors: list[str] | None,
+    custom_text: str | None,
+    verbose: bool,
+    include_filth: bool,
+) -> tuple[str, list[str], list[scrubadub.filth.Filth] | None]:
+    """Scrub ``text`` for one locale.
+
+    Returns:
+        tuple[str, list[str], list[Filth] | None]: The scrubbed text, the
+        detector names used and, when ``include_filth`` is set, the filth found.
+    """
+    scrubber = setup_scrubber(locale, selected_detectors, custom_text, verbose)
+    detector_names = list(scrubber.detectors.keys())
+    if not include_filth:
+        return scrubber.clean(text), detector_names, None
+    # One detection pass serves both the scrubbed text and the filth list.
+    filths = list(scrubber.iter_filth(text))
+    return _replace_filth(text, filths), detector_names, filths
+
+
 def scrub_text(
     text: str,
     locale: str | None = None,
     selected_detectors: list[str] | None = None,
     custom_text: str | None = None,
     verbose: bool = False,
+    include_filth: bool = False,
 ) -> ScrubOutcome:
     """Return scrubbed text for each processed locale.
 
@@ -562,33 +710,51 @@ def scrub_text(
             default detectors for each locale are used.
         custom_text: Optional custom text treated as PII.
         verbose: Whether detector implementations should run in verbose mode.
+        include_filth: Whether to also return the detected filth, taken from
+            the same detection pass that produces the scrubbed text.
 
     Returns:
         ScrubOutcome: Structured result containing scrubbed text, detector
-        metadata, and locale-specific errors.
+        metadata, locale-specific errors and, optionally, the filth found.
 
     Raises:
         Exception: If every locale fails to process.
     """
     scrubbed_texts: dict[str, str] = {}
     detectors_by_locale: dict[str, list[str]] = {}
+    filth_by_locale: dict[str, list[scrubadub.filth.Filth]] | None = {} if include_filth else None
     errors: dict[str, str] = {}
     locales_to_process = ["en_US", "nl_NL"] if locale is None else [locale]
+    # Locales run one after another: the detectors are GIL-bound Python code,
+    # cached spaCy detectors are shared between scrubbers (``setup_scrubber``
+    # sets their verbose flag), and sequential runs keep verbose logs readable.
     for current_locale in locales_to_process:
         try:
-            scrubber = setup_scrubber(current_locale, selected_detectors, custom_text, verbose)
-
-            scrubbed_text = scrubber.clean(text)
-            scrubbed_texts[current_locale] = scrubbed_text
-            detectors_by_locale[current_locale] = list(scrubber.detectors.keys())
+            scrubbed_text, detector_names, filths = _scrub_single_locale(
+                text,
+                current_locale,
+                selected_detectors,
+                custom_text,
+                verbose,
+                include_filth,
+            )
         except Exception as exc:
             logger.warning("Processing failed for locale %s: %s", current_locale, exc)
             errors[current_locale] = str(exc)
             continue
+        scrubbed_texts[current_locale] = scrubbed_text
+        detectors_by_locale[current_locale] = detector_names
+        if filth_by_locale is not None and filths is not None:
+            filth_by_locale[current_locale] = filths
 
     if not scrubbed_texts:
         raise Exception("All processing attempts failed")
-    return ScrubOutcome(texts=scrubbed_texts, detectors=detectors_by_locale, errors=errors)
+    return ScrubOutcome(
+        texts=scrubbed_texts,
+        detectors=detectors_by_locale,
+        errors=errors,
+        filth=filth_by_locale,
+    )
 
 
 def collect_filth(
@@ -609,18 +775,18 @@ def collect_filth(
         Mapping ``locale -> list[Filth]`` where each filth has
         ``replacement_string`` populated by post-processors.
     """
-    from scrubadub import filth as _filth  # noqa: F401  # imported for typing only
+    from sanitize_text.utils.post_processors import HashedPIIReplacer
 
     out: dict[str, list[scrubadub.filth.Filth]] = {}
     locales_to_process = [locale] if locale else ["en_US", "nl_NL"]
+    # Placeholders depend only on filth type and text, so one replacer (and
+    # its memo of seen values) serves every locale.
+    replacer = HashedPIIReplacer()
 
     for current_locale in locales_to_process:
         scrubber = setup_scrubber(current_locale, selected_detectors, custom_text)
         filths = list(scrubber.iter_filth(text))
         # Apply our HashedPIIReplacer explicitly to populate replacement_string
-        from sanitize_text.utils.post_processors import HashedPIIReplacer
-
-        replacer = HashedPIIReplacer()
         filths = replacer.process_filth(filths)
         out[current_locale] = filths
     return out
@@ -1,5 +1,30 @@
 """Utility modules for text sanitization."""
 
-from . import custom_detectors, filth, post_processors
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - for type hints only
+    from sanitize_text.utils import custom_detectors, filth, post_processors
 
 __all__ = ["custom_detectors", "filth", "post_processors"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import the scrubadub-backed submodules on first attribute access.
+
+    Importing them eagerly made every ``sanitize_text.utils`` import (for
+    example ``cleanup`` or ``preconvert`` on CLI startup) load scrubadub and
+    the detector stack, even for ``--help`` and ``--list-detectors``.
+
+    Returns:
+        ModuleType: The requested submodule.
+
+    Raises:
+        AttributeError: If ``name`` is not one of the exported submodules.
+    """
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
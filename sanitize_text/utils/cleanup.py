@@ -11,6 +11,7 @@ import re
 _RE_UNKNOWN_ANGLE = re.compile(r"<UNKNOWN-[^>]*>")
 _RE_UNKNOWN_LINK = re.compile(r"\[([^\]]+)\]\(UNKNOWN-\d+\)")
 _RE_UNKNOWN_BARE = re.compile(r"\bUNKNOWN-\d+\b")
+_RE_SPACE_RUN = re.compile(r"[ \t]{2,}")
 
 # Heuristic: long runs of base64/URL-safe-ish gibberish
 _RE_GIBBERISH_RUN = re.compile(r"([A-Za-z0-9_%=]{80,})")
@@ -28,14 +29,16 @@ def remove_unknown_placeholders(text: str) -> str:
     Returns:
         The input with unknown placeholders removed.
     """
-    # Remove angle-bracket UNKNOWN tokens
-    text = _RE_UNKNOWN_ANGLE.sub("", text)
-    # Replace Markdown links targeting UNKNOWN-* with just the link text
-    text = _RE_UNKNOWN_LINK.sub(r"\1", text)
-    # Remove bare UNKNOWN-* tokens
-    text = _RE_UNKNOWN_BARE.sub("", text)
+    # All three placeholder patterns need this literal; skip their passes otherwise
+    if "UNKNOWN-" in text:
+        # Remove angle-bracket UNKNOWN tokens
+        text = _RE_UNKNOWN_ANGLE.sub("", text)
+        # Replace Markdown links targeting UNKNOWN-* with just the link text
+        text = _RE_UNKNOWN_LINK.sub(r"\1", text)
+        # Remove bare UNKNOWN-* tokens
+        text = _RE_UNKNOWN_BARE.sub("", text)
     # Tidy extra spaces introduced
-    text = re.sub(r"[ \t]{2,}", " ", text)
+    text = _RE_SPACE_RUN.sub(" ", text)
     return text
 
 
@@ -121,6 +124,10 @@ def collapse_long_gibberish_in_brackets(text: str) -> str:
     Returns:
         The input text with long gibberish runs inside brackets collapsed.
     """
+    # Any run inside a block is also a run in the whole text; most inputs
+    # have none, so skip scanning every [] and () block for them.
+    if _RE_GIBBERISH_RUN.search(text) is None:
+        return text
 
     def repl_bracket(m: re.Match[str]) -> str:
         inner = m.group(0)
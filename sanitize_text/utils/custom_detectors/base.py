@@ -5,21 +5,272 @@ from __future__ import annotations
 import json
 import logging
 import re
+from bisect import bisect_right
 from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import ahocorasick
 from scrubadub.detectors import Detector
 
+from sanitize_text.utils.document_cache import DocumentCache, derived
+
 logger = logging.getLogger(__name__)
 
+#: Root directory holding the packaged entity lists.
+_DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+#: Characters treated as part of a word for entity boundary checks. Mirrors the
+#: ``[0-9A-Za-zÀ-ÖØ-öø-ÿ]`` class so boundaries are a set lookup per match
+#: instead of a regex call.
+_WORD_CHARS = frozenset(
+    chr(code)
+    for first, last in (("0", "9"), ("A", "Z"), ("a", "z"), ("À", "Ö"), ("Ø", "ö"), ("ø", "ÿ"))
+    for code in range(ord(first), ord(last) + 1)
+)
+
+#: Zero-width characters (and the soft hyphen) ignored by normalized matching.
+_ZERO_WIDTH_CHARS = frozenset("\u200b\u200c\u200d\u2060\u00ad")
+_ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\u2060\u00AD]")
+_AMPERSAND_RE = re.compile(r"&amp;|&", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+#: Detects a domain-like suffix in the token surrounding a match.
+_URL_SUFFIX_RE = re.compile(r"\.[a-z]{2,15}(?:/|\b)")
+#: Detector names whose matches must contain at least one uppercase letter.
+_CAPITALIZED_ENTITY_TYPES = frozenset({"organization", "location"})
+
+
+def _normalize_for_entity(value: str) -> str:
+    """Return the normalized, lowercase form used for fuzzy entity matching.
+
+    Zero-width characters are stripped, ``&``/``&amp;`` are mapped to ``en``,
+    and whitespace runs are collapsed to a single space.
+
+    Args:
+        value: Text to normalize.
+
+    Returns:
+        str: Normalized lowercase text.
+    """
+    value = _ZERO_WIDTH_RE.sub("", value)
+    value = _AMPERSAND_RE.sub(" en ", value)
+    value = _WHITESPACE_RE.sub(" ", value).strip()
+    return value.lower()
+
+
+#: Dutch stop words and ambiguous tokens never treated as entities. Entity
+#: lists are pruned against this set at load time.
+_DUTCH_COMMON_WORDS = frozenset({
+    "een",
+    "het",
+    "de",
+    "die",
+    "dat",
+    "deze",
+    "dit",
+    "dan",
+    "toen",
+    "als",
+    "maar",
+    "want",
+    "dus",
+    "nog",
+    "al",
+    "naar",
+    "door",
+    "om",
+    "bij",
+    "aan",
+    "van",
+    "in",
+    "op",
+    "te",
+    "ten",
+    "ter",
+    "met",
+    "tot",
+    "voor",
+    "ben",
+    # Ambiguous Dutch words often mistaken for locations when lowercase
+    "hoeven",  # verb/noun
+    "velden",  # plural common noun
+    "drie",  # number
+    "halfweg",  # adverb/compound
+    "heel",  # adverb
+    "waarde",  # noun
+    "zetten",  # verb
+    "nuis",  # common token in context, lowercase only
+    "leiden",  # verb; allow capitalized city name
+    # Common words/fragments that cause false positives
+    "loop",  # common word/UI element
+    "mijlpaal",  # milestone
+    "functioneel",  # functional (job title fragment)
+    "beheerder",  # administrator (job title)
+    "applicatiebeheerder",  # application administrator
+    "medewerker",  # employee
+    "collega",  # colleague
+    "afdeling",  # department
+})
+
+#: English stop words never treated as entities.
+_ENGLISH_COMMON_WORDS = frozenset({
+    "a",
+    "an",
+    "and",
+    "at",
+    "be",
+    "for",
+    "from",
+    "has",
+    "have",
+    "in",
+    "is",
+    "it",
+    "of",
+    "on",
+    "or",
+    "that",
+    "the",
+    "their",
+    "there",
+    "this",
+    "to",
+    "was",
+    "were",
+    "with",
+})
+
+
+@lru_cache(maxsize=16)
+def _load_entity_file(
+    filepath: str,
+    mtime_ns: int,
+    common_words: frozenset[str],
+) -> tuple[str, ...]:
+    """Parse and filter an entity JSON file, memoized per process.
+
+    Detectors sharing a file (and every scrubber built during a WebUI session)
+    reuse the parsed list instead of decoding the JSON again. The modification
+    time is part of the cache key so edits made via ``add-entity`` are picked
+    up without restarting; the small bound evicts the stale copies such edits
+    leave behind in a long-running WebUI process.
+
+    Args:
+        filepath: Absolute path to the JSON entity file.
+        mtime_ns: Modification time of ``filepath``; only used as cache key.
+        common_words: Lowercase words that must never become entities.
+
+    Returns:
+        tuple[str, ...]: Stripped entity strings that passed the filters.
+    """
+    # json.loads accepts UTF-8 bytes directly, skipping the text-mode decoder
+    entities = json.loads(Path(filepath).read_bytes())
+
+    matches: list[str] = []
+    for entity in entities:
+        match = entity["match"].strip()
+        # Skip empty strings, single characters, and common words
+        if (
+            len(match) <= 1
+            or match.lower() in common_words
+            or not any(char.isalpha() for char in match)
+        ):
+            continue
+        matches.append(match)
+    return tuple(matches)
+
+
+@lru_cache(maxsize=32)
+def _lowercase_entities(entities: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the lowercase form of each entity, computed once per entity list.
+
+    Args:
+        entities: Entity strings as loaded from a JSON resource.
+
+    Returns:
+        tuple[str, ...]: Lowercased entities in the same order.
+    """
+    return tuple(entity.lower() for entity in entities)
+
+
+@dataclass(frozen=True)
+class _EntityIndex:
+    """Matching structures built from one entity list.
+
+    Instances are shared between detectors and must be treated as read-only.
+    """
+
+    automaton: ahocorasick.Automaton
+    entity_map: dict[str, str]
+    multi_word_entities: frozenset[str]
+    normalized_entities: dict[str, frozenset[str]]
+    normalized_automaton: ahocorasick.Automaton | None
+
+
+@lru_cache(maxsize=32)
+def _build_entity_index(entities: tuple[str, ...]) -> _EntityIndex:
+    """Build the Aho-Corasick automata for an entity list, memoized per process.
+
+    ``setup_scrubber`` creates new detectors for every scrub, so caching the
+    built automata avoids re-inserting tens of thousands of entities on each
+    request. The second automaton covers the normalization-aware fallback for
+    multi-word entities (``&`` vs ``en``, zero-width characters, whitespace).
+
+    Args:
+        entities: Entity strings in their original casing.
+
+    Returns:
+        _EntityIndex: Automata and lookup tables for the entities.
+    """
+    automaton = ahocorasick.Automaton()
+    entity_map: dict[str, str] = {}
+    multi_word: set[str] = set()
+
+    for entity in entities:
+        # Store lowercase version for case-insensitive matching
+        entity_lower = entity.lower()
+        entity_map[entity_lower] = entity
+        if " " in entity:
+            multi_word.add(entity_lower)
+
+        # Add entity to automaton (case-insensitive)
+        automaton.add_word(entity_lower, entity)
+
+    # Build the automaton (this creates the failure links)
+    automaton.make_automaton()
+
+    grouped: dict[str, set[str]] = {}
+    for entity_lower in multi_word:
+        norm_entity = _normalize_for_entity(entity_lower)
+        if len(norm_entity) < 5:  # Skip very short normalized entities
+            continue
+        grouped.setdefault(norm_entity, set()).add(entity_lower)
+
+    normalized_automaton: ahocorasick.Automaton | None = None
+    if grouped:
+        # Reports every (possibly overlapping) occurrence; overlap resolution
+        # is left to ``_filter_overlapping_candidates``.
+        normalized_automaton = ahocorasick.Automaton()
+        for norm_entity in grouped:
+            normalized_automaton.add_word(norm_entity, norm_entity)
+        normalized_automaton.make_automaton()
+
+    return _EntityIndex(
+        automaton=automaton,
+        entity_map=entity_map,
+        multi_word_entities=frozenset(multi_word),
+        normalized_entities={key: frozenset(value) for key, value in grouped.items()},
+        normalized_automaton=normalized_automaton,
+    )
+
 
 class JSONEntityDetector(Detector):
     """Base class for detectors that load entities from packaged JSON lists."""
 
     #: Common words that should never be considered entities. Subclasses can
     #: override this with locale-specific stop-word sets.
-    COMMON_WORDS: set[str] = set()
+    COMMON_WORDS: frozenset[str] = frozenset()
 
     #: Name of the directory inside ``sanitize_text/data`` that contains the
     #: JSON files for this detector family. Subclasses must override it.
@@ -28,6 +279,10 @@ class JSONEntityDetector(Detector):
     #: Name of the JSON file to load. Subclasses must override it.
     json_file: str
 
+    #: Per-scrub cache shared with the other detectors of the same scrubber;
+    #: assigned by ``setup_scrubber``.
+    _document_cache: DocumentCache | None = None
+
     def __init__(self, **kwargs: object) -> None:
         """Initialize the detector and load entity data from JSON."""
         super().__init__(**kwargs)
@@ -36,7 +291,10 @@ class JSONEntityDetector(Detector):
         # Build Aho-Corasick automaton for efficient multi-pattern matching
         self._automaton: ahocorasick.Automaton | None = None
         self._entity_map: dict[str, str] = {}  # lowercase -> original
-        self._multi_word_entities: set[str] = set()
+        self._multi_word_entities: frozenset[str] = frozenset()
+        # Normalized multi-word entity -> lowercase originals sharing that form
+        self._normalized_entities: dict[str, frozenset[str]] = {}
+        self._normalized_automaton: ahocorasick.Automaton | None = None
         self._build_automaton()
 
     def _load_json_entities(self) -> None:
@@ -49,30 +307,24 @@ class JSONEntityDetector(Detector):
             raise ValueError("data_subdir must be defined for JSONEntityDetector subclasses")
 
         try:
-            data_dir = Path(__file__).parent.parent.parent / "data" / self.data_subdir
-            filepath = data_dir / self.json_file
+            filepath = _DATA_DIR / self.data_subdir / self.json_file
 
             if not filepath.exists():
                 logger.warning("Could not find entity file %s", self.json_file)
                 return
 
-            with open(filepath, encoding="utf-8") as file_handle:
-                entities = json.load(file_handle)
-                for entity in entities:
-                    match = entity["match"].strip()
-                    # Skip empty strings, single characters, and common words
-                    if (
-                        len(match) <= 1
-                        or match.lower() in self.COMMON_WORDS
-                        or not any(char.isalpha() for char in match)
-                    ):
-                        continue
-                    self.entities.append(match)
+            self.entities.extend(
+                _load_entity_file(
+                    str(filepath),
+                    filepath.stat().st_mtime_ns,
+                    frozenset(self.COMMON_WORDS),
+                )
+            )
         except Exception as exc:
             logger.warning("Could not load JSON entity file %s: %s", self.json_file, exc)
 
     def _build_automaton(self) -> None:
-        """Build Aho-Corasick automaton for efficient multi-pattern matching.
+        """Attach the (cached) Aho-Corasick index for ``self.entities``.
 
         The automaton enables O(n + m) matching where n is text length and m is
         the total length of all patterns, versus O(n × p) for individual regex
@@ -81,20 +333,12 @@ class JSONEntityDetector(Detector):
         if not self.entities:
             return
 
-        self._automaton = ahocorasick.Automaton()
-
-        for entity in self.entities:
-            # Store lowercase version for case-insensitive matching
-            entity_lower = entity.lower()
-            self._entity_map[entity_lower] = entity
-            if " " in entity:
-                self._multi_word_entities.add(entity_lower)
-
-            # Add entity to automaton (case-insensitive)
-            self._automaton.add_word(entity_lower, entity)
-
-        # Build the automaton (this creates the failure links)
-        self._automaton.make_automaton()
+        index = _build_entity_index(tuple(self.entities))
+        self._automaton = index.automaton
+        self._entity_map = index.entity_map
+        self._multi_word_entities = index.multi_word_entities
+        self._normalized_entities = index.normalized_entities
+        self._normalized_automaton = index.normalized_automaton
 
     def iter_filth(
         self,
@@ -116,23 +360,11 @@ class JSONEntityDetector(Detector):
             entity_count = len(self.entities)
             logger.info("  [%s] Searching for %d entities...", self.name, entity_count)
 
-        # Helpers for a normalization-aware fallback for multi-word entities
-        def _strip_zw(s: str) -> str:
-            return re.sub(r"[\u200b\u200c\u200d\u2060\u00AD]", "", s)
-
-        def _collapse_ws(s: str) -> str:
-            return re.sub(r"\s+", " ", s).strip()
-
-        def _normalize_for_entity(s: str) -> str:
-            s = _strip_zw(s)
-            s = re.sub(r"&amp;|&", " en ", s, flags=re.IGNORECASE)
-            s = _collapse_ws(s)
-            return s.lower()
-
-        # Unicode-safe letter pattern for word boundary checks
-        letters_pattern = r"[0-9A-Za-zÀ-ÖØ-öø-ÿ]"
-
-        text_lower = text.lower()
+        # ``str.lower`` rather than ``casefold``: casefold expands characters
+        # such as ``ß`` and would shift match offsets.
+        text_lower = derived(self, text, "lower", str.lower)
+        text_len = len(text)
+        require_capital = getattr(self, "name", "") in _CAPITALIZED_ENTITY_TYPES
         seen_spans: set[tuple[int, int]] = set()
         candidates: list[tuple[int, int, str]] = []
 
@@ -147,9 +379,9 @@ class JSONEntityDetector(Detector):
                 continue
 
             # Word boundary check: match must not be inside a larger word
-            if start_idx > 0 and re.match(letters_pattern, text[start_idx - 1]):
+            if start_idx > 0 and text[start_idx - 1] in _WORD_CHARS:
                 continue
-            if end_idx + 1 < len(text) and re.match(letters_pattern, text[end_idx + 1]):
+            if end_idx + 1 < text_len and text[end_idx + 1] in _WORD_CHARS:
                 continue
 
             # Skip if match sits inside a URL or Markdown link
@@ -157,30 +389,18 @@ class JSONEntityDetector(Detector):
             r_pos = end_idx + 1
             while l_pos > 0 and not text[l_pos - 1].isspace() and text[l_pos - 1] not in "[]()<>":
                 l_pos -= 1
-            while r_pos < len(text) and not text[r_pos].isspace() and text[r_pos] not in "[]()<>":
+            while r_pos < text_len and not text[r_pos].isspace() and text[r_pos] not in "[]()<>":
                 r_pos += 1
             token = text[l_pos:r_pos].lower()
-            if (
-                "://" in token
-                or token.startswith("www.")
-                or re.search(r"\.[a-z]{2,15}(?:/|\b)", token)
-            ):
+            if "://" in token or token.startswith("www.") or _URL_SUFFIX_RE.search(token):
                 continue
 
             # For very short entities (<=3 chars), require capitalization
             if len(original_entity) <= 3 and matched_text.islower():
                 continue
 
-            # Skip lowercase stopwords (allow capitalized versions)
-            if matched_text.islower() and matched_text.lower() in self.COMMON_WORDS:
-                continue
-
             # For organization/location, require at least one uppercase letter
-            if getattr(self, "name", "") in {"organization", "location"} and matched_text.islower():
-                continue
-
-            # Must contain at least one alphabetic character
-            if not any(char.isalpha() for char in matched_text):
+            if require_capital and matched_text.islower():
                 continue
 
             seen_spans.add((start_idx, end_idx + 1))
@@ -188,7 +408,7 @@ class JSONEntityDetector(Detector):
 
         # Fallback: normalization-aware search for multi-word entities
         # Handles cases like "Foo & Bar" matching "Foo en Bar" or zero-width chars
-        if self._multi_word_entities:
+        if self._normalized_automaton:
             self._search_normalized_entities(
                 text=text,
                 document_name=document_name,
@@ -199,16 +419,18 @@ class JSONEntityDetector(Detector):
 
         filtered = self._filter_overlapping_candidates(candidates)
         match_count = len(filtered)
+        filth_cls = self.filth_cls
+        detector_name = self.name
 
         for start_idx, end_idx, matched_text in filtered:
             if verbose:
-                logger.info("    ✓ Found: '%s' (%s)", matched_text, self.name)
+                logger.info("    ✓ Found: '%s' (%s)", matched_text, detector_name)
 
-            yield self.filth_cls(
+            yield filth_cls(
                 beg=start_idx,
                 end=end_idx,
                 text=matched_text,
-                detector_name=self.name,
+                detector_name=detector_name,
                 document_name=document_name,
             )
 
@@ -224,105 +446,58 @@ class JSONEntityDetector(Detector):
         candidates: list[tuple[int, int, str]],
     ) -> None:
         """Fallback search for multi-word entities with normalization."""
+        norm_text = derived(self, text, "entity_normalized", _normalize_for_entity)
+        text_len = len(text)
+        require_capital = getattr(self, "name", "") in _CAPITALIZED_ENTITY_TYPES
+        # Entities already matched via automaton skip this expensive fallback
+        matched_lower = {text[s:e].lower() for s, e in seen_spans}
+
+        for norm_end, norm_entity in self._normalized_automaton.iter(norm_text):
+            if self._normalized_entities[norm_entity] <= matched_lower:
+                continue
+
+            # Map normalized position back to original text span
+            start, end = self._map_normalized_span(
+                text=text,
+                norm_idx=norm_end - len(norm_entity) + 1,
+                norm_len=len(norm_entity),
+            )
 
-        def _strip_zw(s: str) -> str:
-            return re.sub(r"[\u200b\u200c\u200d\u2060\u00AD]", "", s)
+            if start is None or end is None or start >= end:
+                continue
 
-        def _collapse_ws(s: str) -> str:
-            return re.sub(r"\s+", " ", s).strip()
+            # Skip if already matched
+            if (start, end) in seen_spans:
+                continue
 
-        def _normalize_for_entity(s: str) -> str:
-            s = _strip_zw(s)
-            s = re.sub(r"&amp;|&", " en ", s, flags=re.IGNORECASE)
-            s = _collapse_ws(s)
-            return s.lower()
+            original_slice = text[start:end]
 
-        norm_text = _normalize_for_entity(text)
-        letters_pattern = r"[0-9A-Za-zÀ-ÖØ-öø-ÿ]"
+            if "\n" in original_slice or "\r" in original_slice:
+                continue
 
-        for entity_lower in self._multi_word_entities:
-            # Already matched via automaton, skip this expensive fallback
-            if any(entity_lower == text[s:e].lower() for s, e in seen_spans):
+            # Word boundary check
+            if start > 0 and text[start - 1] in _WORD_CHARS:
+                continue
+            if end < text_len and text[end] in _WORD_CHARS:
                 continue
 
-            norm_entity = _normalize_for_entity(entity_lower)
-            if len(norm_entity) < 5:  # Skip very short normalized entities
+            # URL/Markdown check
+            ll = start
+            rr = end
+            while ll > 0 and not text[ll - 1].isspace() and text[ll - 1] not in "[]()<>":
+                ll -= 1
+            while rr < text_len and not text[rr].isspace() and text[rr] not in "[]()<>":
+                rr += 1
+            tok2 = text[ll:rr].lower()
+            if "://" in tok2 or tok2.startswith("www.") or _URL_SUFFIX_RE.search(tok2):
                 continue
 
-            pos = 0
-            while True:
-                idx = norm_text.find(norm_entity, pos)
-                if idx == -1:
-                    break
-
-                # Map normalized position back to original text span
-                start, end = self._map_normalized_span(
-                    text=text,
-                    norm_idx=idx,
-                    norm_len=len(norm_entity),
-                )
+            # Organization/location capitalization check
+            if require_capital and original_slice.islower():
+                continue
 
-                if start is None or end is None or start >= end:
-                    pos = idx + 1
-                    continue
-
-                # Skip if already matched
-                if (start, end) in seen_spans:
-                    pos = idx + 1
-                    continue
-
-                original_slice = text[start:end]
-
-                # Apply same filters as main search
-                if not any(char.isalpha() for char in original_slice):
-                    pos = idx + 1
-                    continue
-
-                if "\n" in original_slice or "\r" in original_slice:
-                    pos = idx + 1
-                    continue
-
-                # Word boundary check
-                if start > 0 and re.match(letters_pattern, text[start - 1]):
-                    pos = idx + 1
-                    continue
-                if end < len(text) and re.match(letters_pattern, text[end]):
-                    pos = idx + 1
-                    continue
-
-                # Stopwords check
-                if original_slice.strip().lower() in self.COMMON_WORDS:
-                    pos = idx + 1
-                    continue
-
-                # URL/Markdown check
-                ll = start
-                rr = end
-                while ll > 0 and not text[ll - 1].isspace() and text[ll - 1] not in "[]()<>":
-                    ll -= 1
-                while rr < len(text) and not text[rr].isspace() and text[rr] not in "[]()<>":
-                    rr += 1
-                tok2 = text[ll:rr].lower()
-                if (
-                    "://" in tok2
-                    or tok2.startswith("www.")
-                    or re.search(r"\.[a-z]{2,15}(?:/|\b)", tok2)
-                ):
-                    pos = idx + 1
-                    continue
-
-                # Organization/location capitalization check
-                if (
-                    getattr(self, "name", "") in {"organization", "location"}
-                    and original_slice.islower()
-                ):
-                    pos = idx + 1
-                    continue
-
-                seen_spans.add((start, end))
-                candidates.append((start, end, original_slice))
-
-                pos = idx + 1
+            seen_spans.add((start, end))
+            candidates.append((start, end, original_slice))
 
     @staticmethod
     def _filter_overlapping_candidates(
@@ -337,16 +512,24 @@ class JSONEntityDetector(Detector):
             key=lambda item: (-(item[1] - item[0]), item[0]),
         )
         selected: list[tuple[int, int, str]] = []
-        spans: list[tuple[int, int]] = []
+        # Accepted spans never overlap, so starts and ends are both sorted and
+        # only the neighbours of the insertion point can conflict. ``selected``
+        # is kept in the same positional order, so no final sort is needed.
+        starts: list[int] = []
+        ends: list[int] = []
 
         for candidate in ranked:
             start, end, _ = candidate
-            if any(not (end <= s or start >= e) for s, e in spans):
+            idx = bisect_right(starts, start)
+            if idx > 0 and ends[idx - 1] > start:
+                continue
+            if idx < len(starts) and starts[idx] < end:
                 continue
-            selected.append(candidate)
-            spans.append((start, end))
+            selected.insert(idx, candidate)
+            starts.insert(idx, start)
+            ends.insert(idx, end)
 
-        return sorted(selected, key=lambda item: item[0])
+        return selected
 
     def _map_normalized_span(
         self,
@@ -371,7 +554,7 @@ class JSONEntityDetector(Detector):
         # Find start position in original text
         while j < tlen and norm_count < norm_idx:
             ch = text[j]
-            if re.match(r"[\u200b\u200c\u200d\u2060\u00AD]", ch):
+            if ch in _ZERO_WIDTH_CHARS:
                 j += 1
                 continue
             if ch == "&":
@@ -396,7 +579,7 @@ class JSONEntityDetector(Detector):
         norm_taken = 0
         while j < tlen and norm_taken < norm_len:
             ch = text[j]
-            if re.match(r"[\u200b\u200c\u200d\u2060\u00AD]", ch):
+            if ch in _ZERO_WIDTH_CHARS:
                 j += 1
                 continue
             if text[j : j + 5].lower() == "&amp;":
@@ -444,97 +627,23 @@ class DutchEntityDetector(JSONEntityDetector):
         # Filter out entities already loaded by higher-priority detectors
         cache = type(self)._dutch_loaded_entities
         original_count = len(self.entities)
-        self.entities = [e for e in self.entities if e.lower() not in cache]
+        lowered = _lowercase_entities(tuple(self.entities))
+        self.entities = [
+            entity for entity, key in zip(self.entities, lowered, strict=True) if key not in cache
+        ]
         # Track newly loaded entities for future detectors
-        for entity in self.entities:
-            cache.add(entity.lower())
+        cache.update(lowered)
         # Log filtering if significant
         removed = original_count - len(self.entities)
         if removed > 0:
             logger.info("  [%s] Filtered %d duplicate entities", self.name, removed)
 
-    COMMON_WORDS = {
-        "een",
-        "het",
-        "de",
-        "die",
-        "dat",
-        "deze",
-        "dit",
-        "die",
-        "dan",
-        "toen",
-        "als",
-        "maar",
-        "want",
-        "dus",
-        "nog",
-        "al",
-        "naar",
-        "door",
-        "om",
-        "bij",
-        "aan",
-        "van",
-        "in",
-        "op",
-        "te",
-        "ten",
-        "ter",
-        "met",
-        "tot",
-        "voor",
-        "ben",
-        # Ambiguous Dutch words often mistaken for locations when lowercase
-        "hoeven",  # verb/noun
-        "velden",  # plural common noun
-        "drie",  # number
-        "halfweg",  # adverb/compound
-        "heel",  # adverb
-        "waarde",  # noun
-        "zetten",  # verb
-        "nuis",  # common token in context, lowercase only
-        "leiden",  # verb; allow capitalized city name
-        # Common words/fragments that cause false positives
-        "loop",  # common word/UI element
-        "mijlpaal",  # milestone
-        "functioneel",  # functional (job title fragment)
-        "beheerder",  # administrator (job title)
-        "applicatiebeheerder",  # application administrator
-        "medewerker",  # employee
-        "collega",  # colleague
-        "afdeling",  # department
-    }
+    COMMON_WORDS = _DUTCH_COMMON_WORDS
     data_subdir = "nl_entities"
 
 
 class EnglishEntityDetector(JSONEntityDetector):
     """Base class for English entity detectors."""
 
-    COMMON_WORDS = {
-        "a",
-        "an",
-        "and",
-        "at",
-        "be",
-        "for",
-        "from",
-        "has",
-        "have",
-        "in",
-        "is",
-        "it",
-        "of",
-        "on",
-        "or",
-        "that",
-        "the",
-        "their",
-        "there",
-        "this",
-        "to",
-        "was",
-        "were",
-        "with",
-    }
+    COMMON_WORDS = _ENGLISH_COMMON_WORDS
     data_subdir = "en_entities"
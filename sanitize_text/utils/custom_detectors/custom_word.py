@@ -28,18 +28,18 @@ class CustomWordDetector(Detector):
         if not self.custom_text or not text:
             return
 
-        # Find all occurrences of the custom text
-        start = 0
-        while True:
-            start = text.find(self.custom_text, start)
-            if start == -1:
-                break
-
+        # Find all occurrences, including overlapping ones: the scrubber merges
+        # overlapping spans into their union, so skipping them would leave the
+        # tail of a repeated phrase unredacted.
+        needle = self.custom_text
+        needle_len = len(needle)
+        start = text.find(needle)
+        while start != -1:
             yield self.filth_cls(
                 beg=start,
-                end=start + len(self.custom_text),
-                text=self.custom_text,
+                end=start + needle_len,
+                text=needle,
                 detector_name=self.name,
                 document_name=document_name,
             )
-            start += 1
+            start = text.find(needle, start + 1)
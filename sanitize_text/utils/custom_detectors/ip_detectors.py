@@ -4,14 +4,104 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 
 from scrubadub.detectors import RegexDetector, register_detector
 
+from sanitize_text.utils.document_cache import DocumentCache, derived
 from sanitize_text.utils.filth import PrivateIPFilth, PublicIPFilth
 
 logger = logging.getLogger(__name__)
 
+#: Zero-width match at every word boundary that starts a dotted quad. The
+#: lookahead reports overlapping candidates so each detector can reproduce
+#: the leftmost non-overlapping matches of a dedicated range regex.
+_IPV4_CANDIDATE_RE = re.compile(r"\b(?=(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b)")
+
+#: Second octets of 172.x addresses that are excluded from public matches.
+_PRIVATE_172_SECOND_OCTETS = frozenset(str(octet) for octet in range(16, 32))
+
+
+def _is_private_ipv4(first: str, second: str) -> bool:
+    """Return whether the leading octets fall in a range flagged as private.
+
+    Octets are compared as strings so zero-padded values such as ``010`` are
+    treated exactly like the literal prefixes of the original patterns.
+
+    Args:
+        first: First octet as matched in the text.
+        second: Second octet as matched in the text.
+
+    Returns:
+        bool: ``True`` for 192.168.x.x, 10.0.x.x and 172.x.x.x addresses.
+    """
+    if first == "192":
+        return second == "168"
+    if first == "10":
+        return second == "0"
+    return first == "172"
+
+
+def _is_public_ipv4(first: str, second: str) -> bool:
+    """Return whether the leading octets fall outside the private ranges.
+
+    Args:
+        first: First octet as matched in the text.
+        second: Second octet as matched in the text.
+
+    Returns:
+        bool: ``False`` for 192.168.x.x, 10.0.x.x and 172.16-31.x.x addresses.
+    """
+    if first == "192":
+        return second != "168"
+    if first == "10":
+        return second != "0"
+    if first == "172":
+        return second not in _PRIVATE_172_SECOND_OCTETS
+    return True
+
+
+def _ipv4_candidates(text: str) -> tuple[tuple[int, str], ...]:
+    """Return every dotted-quad candidate in ``text``, including overlapping ones.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        tuple[tuple[int, str], ...]: Start offset and address of each candidate.
+    """
+    return tuple((match.start(), match.group(1)) for match in _IPV4_CANDIDATE_RE.finditer(text))
+
+
+def _iter_ipv4_matches(
+    detector: object,
+    text: str,
+    accept: Callable[[str, str], bool],
+) -> Iterator[tuple[int, int, str]]:
+    """Yield non-overlapping dotted quads whose leading octets satisfy ``accept``.
+
+    The private and public detectors scan the same document back to back; the
+    candidate scan goes through the scrubber's document cache so the text is
+    only walked by the regex once per scrub.
+
+    Args:
+        detector: Detector whose document cache holds the shared candidates.
+        text: Text to scan.
+        accept: Predicate receiving the first and second octet.
+
+    Yields:
+        tuple[int, int, str]: Start offset, end offset and matched address.
+    """
+    last_end = 0
+    for start, address in derived(detector, text, "ipv4_candidates", _ipv4_candidates):
+        if start < last_end:
+            continue
+        first, second, _ = address.split(".", 2)
+        if not accept(first, second):
+            continue
+        last_end = start + len(address)
+        yield start, last_end, address
+
 
 @register_detector
 class PrivateIPDetector(RegexDetector):
@@ -26,10 +116,11 @@ class PrivateIPDetector(RegexDetector):
     name = "private_ip"
     filth_cls = PrivateIPFilth
 
-    # Compile the regex pattern to match the IP ranges
-    regex = re.compile(
-        r"\b(?:192\.168\.\d{1,3}\.\d{1,3}|10\.0\.\d{1,3}\.\d{1,3}|172\.\d{1,3}\.\d{1,3}\.\d{1,3})\b"
-    )
+    # Candidate dotted quads; ranges are checked on the octets
+    regex = _IPV4_CANDIDATE_RE
+
+    #: Per-scrub cache shared with the other IP detector; set by ``setup_scrubber``.
+    _document_cache: DocumentCache | None = None
 
     def iter_filth(self, text: str, document_name: str | None = None) -> Iterator[PrivateIPFilth]:
         """Yield private IP filth with optional verbose logging."""
@@ -38,14 +129,14 @@ class PrivateIPDetector(RegexDetector):
             logger.info("  [%s] Scanning for private IPs...", self.name)
 
         match_count = 0
-        for match in self.regex.finditer(text):
+        for start, end, address in _iter_ipv4_matches(self, text, _is_private_ipv4):
             match_count += 1
             if verbose:
-                logger.info("    ✓ Found: '%s' (%s)", match.group(), self.name)
+                logger.info("    ✓ Found: '%s' (%s)", address, self.name)
             yield self.filth_cls(
-                beg=match.start(),
-                end=match.end(),
-                text=match.group(),
+                beg=start,
+                end=end,
+                text=address,
                 detector_name=self.name,
                 document_name=document_name,
             )
@@ -68,13 +159,11 @@ class PublicIPDetector(RegexDetector):
     name = "public_ip"
     filth_cls = PublicIPFilth
 
-    # Regex pattern for identifying public IP addresses
-    # Exclude private ranges and match valid IPv4 addresses
-    regex = re.compile(
-        r"\b(?!(?:192\.168|10\.0|172\.(?:1[6-9]|2[0-9]|3[0-1]))\."
-        r"\d{1,3}\.\d{1,3})"
-        r"(?:\d{1,3}\.){3}\d{1,3}\b"
-    )
+    # Candidate dotted quads; private ranges are excluded on the octets
+    regex = _IPV4_CANDIDATE_RE
+
+    #: Per-scrub cache shared with the other IP detector; set by ``setup_scrubber``.
+    _document_cache: DocumentCache | None = None
 
     def iter_filth(self, text: str, document_name: str | None = None) -> Iterator[PublicIPFilth]:
         """Yield public IP filth with optional verbose logging."""
@@ -83,14 +172,14 @@ class PublicIPDetector(RegexDetector):
             logger.info("  [%s] Scanning for public IPs...", self.name)
 
         match_count = 0
-        for match in self.regex.finditer(text):
+        for start, end, address in _iter_ipv4_matches(self, text, _is_public_ipv4):
             match_count += 1
             if verbose:
-                logger.info("    ✓ Found: '%s' (%s)", match.group(), self.name)
+                logger.info("    ✓ Found: '%s' (%s)", address, self.name)
             yield self.filth_cls(
-                beg=match.start(),
-                end=match.end(),
-                text=match.group(),
+                beg=start,
+                end=end,
+                text=address,
                 detector_name=self.name,
                 document_name=document_name,
             )
@@ -35,36 +35,29 @@ class MarkdownUrlDetector(RegexDetector):
     # List of common TLDs to match against
     COMMON_TLDS = BareDomainDetector.COMMON_TLDS
 
-    def __init__(self, **kwargs: object) -> None:
-        """Initialize the detector with optional configuration."""
-        super().__init__(**kwargs)
-
-        # Build the URL pattern piece by piece (not needed explicitly with
-        # DOTALL capture)
-
-        # Pattern for Markdown links. We purposefully capture the URL in a *separate
-        # group* (``group(2)``) so that ``iter_filth`` can reliably access it. Key
-        # considerations:
-        #
-        # * Link text may be empty.
-        # * The URL can contain whitespace (Word-exported Markdown tends to insert
-        #   soft-line-breaks), parentheses, query strings, Unicode, etc.
-        # * Multiline input is allowed – we therefore compile with the DOTALL flag.
-        # * We do **not** attempt full RFC-compliant URL validation here – the goal
-        #   is only to capture the complete contents between the parentheses so the
-        #   detector can replace it as a whole.
-        self.regex = re.compile(
-            # group 'open': one or two opening brackets;
-            # 'text': link text; 'close': matching closers
-            r"(?P<open>\[\[|\[)"
-            r"(?P<text>[^\]]*)"
-            r"(?P<close>\]\]|\])"
-            r"\("  # opening parenthesis
-            # group 'url': tolerate internal parens; allow newlines (DOTALL)
-            r"(?P<url>[^)]+?|(?:[^)]*\([^)]*\)[^)]*))"
-            r"\)",  # closing parenthesis
-            re.IGNORECASE | re.DOTALL,
-        )
+    # Pattern for Markdown links, compiled once for the class. We purposefully
+    # capture the URL in a *separate group* (``group(2)``) so that ``iter_filth``
+    # can reliably access it. Key considerations:
+    #
+    # * Link text may be empty.
+    # * The URL can contain whitespace (Word-exported Markdown tends to insert
+    #   soft-line-breaks), parentheses, query strings, Unicode, etc.
+    # * Multiline input is allowed – we therefore compile with the DOTALL flag.
+    # * We do **not** attempt full RFC-compliant URL validation here – the goal
+    #   is only to capture the complete contents between the parentheses so the
+    #   detector can replace it as a whole.
+    regex = re.compile(
+        # group 'open': one or two opening brackets;
+        # 'text': link text; 'close': matching closers
+        r"(?P<open>\[\[|\[)"
+        r"(?P<text>[^\]]*)"
+        r"(?P<close>\]\]|\])"
+        r"\("  # opening parenthesis
+        # group 'url': tolerate internal parens; allow newlines (DOTALL)
+        r"(?P<url>[^)]+?|(?:[^)]*\([^)]*\)[^)]*))"
+        r"\)",  # closing parenthesis
+        re.IGNORECASE | re.DOTALL,
+    )
 
     def iter_filth(
         self,
@@ -76,6 +69,13 @@ class MarkdownUrlDetector(RegexDetector):
         if verbose:
             logger.info("  [%s] Scanning for Markdown URLs...", self.name)
 
+        # Every Markdown link contains "](", so plain text (the common case
+        # alongside the bare-domain URL scan) skips the regex pass entirely.
+        if "](" not in text:
+            if verbose:
+                logger.info("  [%s] Total matches: %d", self.name, 0)
+            return
+
         match_count = 0
         for match in self.regex.finditer(text):
             open_br = match.group("open")
@@ -15,6 +15,9 @@ from scrubadub.filth.url import UrlFilth
 
 logger = logging.getLogger(__name__)
 
+#: Punctuation and quotes that exports tend to leave glued to the end of a link.
+_TRAILING_JUNK = "]).,;:>'\""
+
 
 @register_detector
 class SharePointUrlDetector(RegexDetector):
@@ -26,18 +29,12 @@ class SharePointUrlDetector(RegexDetector):
     name = "sharepoint_url"
     filth_cls = UrlFilth
 
-    def __init__(self, **kwargs: object) -> None:
-        """Initialize the SharePoint URL detector.
-
-        Sets up the regex pattern for detecting SharePoint URLs.
-        """
-        super().__init__(**kwargs)
-        # Match protocol URLs to *.sharepoint.com with generous path
-        # Permit a single newline inside the path to accommodate wrapped exports
-        self.regex = re.compile(
-            r"\bhttps?://[a-z0-9.-]*sharepoint\.com/(?:[^\s<>)\]]|\n)+",
-            re.IGNORECASE,
-        )
+    # Match protocol URLs to *.sharepoint.com with generous path
+    # Permit a single newline inside the path to accommodate wrapped exports
+    regex = re.compile(
+        r"\bhttps?://[a-z0-9.-]*sharepoint\.com/(?:[^\s<>)\]]|\n)+",
+        re.IGNORECASE,
+    )
 
     def iter_filth(
         self,
@@ -64,9 +61,9 @@ class SharePointUrlDetector(RegexDetector):
         for m in self.regex.finditer(text):
             url = m.group(0)
             # Remove any whitespace that got inserted in very long URLs
-            url = re.sub(r"\s+", "", url)
+            url = "".join(url.split())
             # Trim trailing punctuation/junk that may cling to URLs, incl quotes
-            url = re.sub(r"[\]\)\.,;:>'\"]+$", "", url)
+            url = url.rstrip(_TRAILING_JUNK)
 
             match_count += 1
             if verbose:
@@ -11,6 +11,9 @@ from scrubadub.filth.url import UrlFilth
 
 logger = logging.getLogger(__name__)
 
+_TRAILING_JUNK_RE = re.compile(r"[\]\)\.,;:>]+$")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
 
 @register_detector
 class BareDomainDetector(RegexDetector):
@@ -27,51 +30,44 @@ class BareDomainDetector(RegexDetector):
     name = "url"
     filth_cls = UrlFilth
 
-    # List of common TLDs to match against
+    # List of common TLDs to match against. Every two-letter (country code)
+    # TLD is covered by the ``[a-z][a-z]`` class, so only longer names are listed.
     COMMON_TLDS = (
         "com|net|org|edu|gov|mil|biz|info|name|museum|coop|aero|"
-        "[a-z][a-z]|nl|uk|us|eu|de|fr|es|it|ru|cn|jp|br|pl|in|au|"
-        "dev|app|io|ai|cloud|digital|tech|online|site|web|blog|shop|store|"
+        "[a-z][a-z]|"
+        "dev|app|cloud|digital|tech|online|site|web|blog|shop|store|"
         "academy|agency|business|center|company|consulting|foundation|institute|"
         "international|management|marketing|solutions|technology|university|"
         "systems|services|support|science|software|studio|training|ventures|"
         "sharepoint|microsoft"
     )
 
-    def __init__(self, **kwargs: object) -> None:
-        """Initialize the detector with optional configuration."""
-        super().__init__(**kwargs)
-
-        # Build the URL pattern piece by piece
-        tld_pattern = f"(?:{self.COMMON_TLDS})"
-
-        # Simple but effective URL pattern
-        url_pattern = (
-            # Start with word boundary and make sure we're not in an email address
-            r"(?<![@\(\[])\b"
-            r"(?:"
-            # Protocol URLs
-            r"(?:https?://(?:www\.)?|ftp://)"
-            r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)*"  # subdomains
-            r"[a-z0-9](?:[a-z0-9-]*[a-z0-9])?"  # domain
-            r"\."
-            + tld_pattern  # TLD
-            + r"(?:/[^\s<>]*)?"  # path and query
-            r"|"
-            # Bare domains with optional www
-            r"(?<![@.])"  # Not preceded by @ or .
-            r"(?:www\.)?"  # optional www
-            r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)*"  # subdomains
-            r"[a-z0-9](?:[a-z0-9-]*[a-z0-9])?"  # domain
-            r"\."
-            + tld_pattern  # TLD
-            + r"(?:/[^\s<>]*)?"  # path and query
-            r")"
-            r"\b"
-        )
-
-        # Compile the pattern
-        self.regex = re.compile(url_pattern, re.IGNORECASE)
+    # Compiled once for the class; ``setup_scrubber`` creates a new detector
+    # for every scrub. Start with word boundary and make sure we're not in an
+    # email address.
+    regex = re.compile(
+        r"(?<![@\(\[])\b"
+        r"(?:"
+        # Protocol URLs
+        r"(?:https?://(?:www\.)?|ftp://)"
+        r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)*"  # subdomains
+        r"[a-z0-9](?:[a-z0-9-]*[a-z0-9])?"  # domain
+        r"\."
+        f"(?:{COMMON_TLDS})"  # TLD
+        r"(?:/[^\s<>]*)?"  # path and query
+        r"|"
+        # Bare domains with optional www
+        r"(?<![@.])"  # Not preceded by @ or .
+        r"(?:www\.)?"  # optional www
+        r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)*"  # subdomains
+        r"[a-z0-9](?:[a-z0-9-]*[a-z0-9])?"  # domain
+        r"\."
+        f"(?:{COMMON_TLDS})"  # TLD
+        r"(?:/[^\s<>]*)?"  # path and query
+        r")"
+        r"\b",
+        re.IGNORECASE,
+    )
 
     def iter_filth(
         self,
@@ -89,10 +85,11 @@ class BareDomainDetector(RegexDetector):
             logger.info("  [%s] Scanning for URLs...", self.name)
 
         match_count = 0
+        doc_mentions_sharepoint: bool | None = None
         for m in self.regex.finditer(text):
             url = m.group(0)
             # Trim common trailing punctuation/junk that may cling to URLs
-            url = re.sub(r"[\]\)\.,;:>]+$", "", url)
+            url = _TRAILING_JUNK_RE.sub("", url)
             # Extract host part (before first slash) to examine domain fragment
             host = url.split("/", 1)[0].lower()
             # Heuristic: Skip mixed-case bare domains without protocol or www
@@ -107,8 +104,8 @@ class BareDomainDetector(RegexDetector):
                 window = 20
                 lookback = text[max(0, start - window) : start]
                 lookahead = text[end : min(len(text), end + window)]
-                prev = re.sub(r"[^a-z0-9]+", "", lookback.lower())
-                next_ = re.sub(r"[^a-z0-9]+", "", lookahead.lower())
+                prev = _NON_ALNUM_RE.sub("", lookback.lower())
+                next_ = _NON_ALNUM_RE.sub("", lookahead.lower())
                 if prev.endswith("share") or next_.startswith("share"):
                     continue
                 # Recompose candidate full domain to catch wider splits
@@ -119,24 +116,23 @@ class BareDomainDetector(RegexDetector):
                 if combined_prev or combined_next:
                     continue
                 # Wider window: look for 'sharepointcom' across boundaries
-                combined = prev[-30:] + re.sub(r"[^a-z0-9]+", "", host) + next_[:30]
+                combined = prev[-30:] + _NON_ALNUM_RE.sub("", host) + next_[:30]
                 if "sharepointcom" in combined:
                     continue
                 # If the host itself is a known fragment, scan a much larger window
                 if host in {"epoint.com", "harepoint.com", "point.com"}:
                     span_start = max(0, start - 1500)
                     span_end = min(len(text), end + 1500)
-                    span = re.sub(
-                        r"[^a-z0-9]+",
-                        "",
-                        text[span_start:span_end].lower(),
-                    )
+                    span = _NON_ALNUM_RE.sub("", text[span_start:span_end].lower())
                     if "sharepointcom" in span or "sharepoint" in span:
                         continue
                     # Document-level heuristic: if the whole document references
                     # sharepoint, treat these exact fragments as false positives.
-                    doc_squeezed = re.sub(r"[^a-z0-9]+", "", text.lower())
-                    if "sharepoint" in doc_squeezed:
+                    # Computed once per scan; the document does not change.
+                    if doc_mentions_sharepoint is None:
+                        doc_squeezed = _NON_ALNUM_RE.sub("", text.lower())
+                        doc_mentions_sharepoint = "sharepoint" in doc_squeezed
+                    if doc_mentions_sharepoint:
                         continue
                     # Line-based fallback: check the current line (sanitized)
                     line_start = text.rfind("\n", 0, start) + 1
@@ -145,11 +141,7 @@ class BareDomainDetector(RegexDetector):
                     line_end = text.find("\n", end)
                     if line_end == -1:
                         line_end = len(text)
-                    line = re.sub(
-                        r"[^a-z0-9]+",
-                        "",
-                        text[line_start:line_end].lower(),
-                    )
+                    line = _NON_ALNUM_RE.sub("", text[line_start:line_end].lower())
                     if "sharepointcom" in line or "sharepoint" in line:
                         continue
 
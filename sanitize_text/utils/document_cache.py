@@ -0,0 +1,70 @@
+"""Per-scrub cache for derived forms of the document being scrubbed.
+
+Several detectors scan the same document back to back and need the same
+derived data (the lowercased text, the normalized text, IPv4 candidates).
+``setup_scrubber`` gives every scrubber one :class:`DocumentCache` shared by
+its detectors, so that work happens once per scrub. The cache lives and dies
+with the scrubber: nothing derived from the (PII-bearing) document outlives
+the scrub in module-level state.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+class DocumentCache:
+    """Memoize values computed from a single document.
+
+    Values are keyed by name and tied to the document they were computed
+    from; scanning a different document discards them.
+    """
+
+    __slots__ = ("_text", "_values")
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._text: str | None = None
+        self._values: dict[str, Any] = {}
+
+    def get(self, text: str, key: str, compute: Callable[[str], Any]) -> Any:
+        """Return ``compute(text)``, reusing the value cached under ``key``.
+
+        Args:
+            text: Document being scanned.
+            key: Name of the derived value.
+            compute: Function deriving the value from ``text``.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        if text is not self._text:
+            self._text = text
+            self._values = {}
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = compute(text)
+            return value
+
+
+def derived(detector: object, text: str, key: str, compute: Callable[[str], Any]) -> Any:
+    """Return ``compute(text)`` through ``detector``'s document cache, if any.
+
+    Detectors used on their own (outside ``setup_scrubber``) have no cache and
+    simply compute the value.
+
+    Args:
+        detector: Detector that may carry a ``_document_cache`` attribute.
+        text: Document being scanned.
+        key: Name of the derived value.
+        compute: Function deriving the value from ``text``.
+
+    Returns:
+        The derived value.
+    """
+    cache: DocumentCache | None = getattr(detector, "_document_cache", None)
+    if cache is None:
+        return compute(text)
+    return cache.get(text, key, compute)
@@ -6,9 +6,65 @@ that both the Web UI and CLI can reuse the same conversion logic.
 
 from __future__ import annotations
 
+import mmap
 from pathlib import Path
 from typing import Any
 
+#: Non-PDF extensions mapped to the ``preconvert`` helper that extracts them.
+_PRECONVERT_HANDLERS = {
+    ".doc": "docx_to_text",
+    ".docx": "docx_to_text",
+    ".rtf": "rtf_to_text",
+    ".png": "image_to_text",
+    ".jpg": "image_to_text",
+    ".jpeg": "image_to_text",
+    ".tif": "image_to_text",
+    ".tiff": "image_to_text",
+    ".bmp": "image_to_text",
+    ".webp": "image_to_text",
+}
+
+
+def decode_text_bytes(data: bytes | mmap.mmap) -> str:
+    r"""Decode UTF-8 input bytes the way text-mode ``open`` would.
+
+    Invalid bytes are replaced and ``\r\n``/``\r`` line endings become
+    ``\n``. Detectors that follow URLs across wrapped lines only match on
+    ``\n``, so carriage returns must not reach the scrubber.
+
+    Args:
+        data: Raw file or stdin contents, or a memory map of a file.
+
+    Returns:
+        str: Decoded text with universal newlines applied.
+    """
+    text = str(data, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+#: Plain-text inputs at least this large are decoded straight from a memory map.
+_MMAP_THRESHOLD_BYTES = 100 * 1024 * 1024
+
+
+def _read_utf8_text(path: Path) -> str:
+    """Return the UTF-8 text of ``path`` with invalid bytes replaced.
+
+    Large files are decoded from a read-only memory map so the raw bytes are
+    paged in by the kernel instead of being copied into a ``bytes`` object
+    alongside the decoded string.
+
+    Returns:
+        str: Decoded file contents.
+    """
+    with open(path, "rb") as handle:
+        size = path.stat().st_size
+        if size < _MMAP_THRESHOLD_BYTES:
+            return decode_text_bytes(handle.read())
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_text_bytes(mapped)
+
 
 def read_file_to_text(
     upload_path: Path,
@@ -48,10 +104,7 @@ def read_file_to_text(
         else:
             raw_md = preconvert_module.to_markdown(str(upload_path))
         return normalize_pdf_text_func(raw_md, title=None)
-    if ext in {".doc", ".docx"}:
-        return preconvert_module.docx_to_text(str(upload_path))
-    if ext == ".rtf":
-        return preconvert_module.rtf_to_text(str(upload_path))
-    if ext in {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp"}:
-        return preconvert_module.image_to_text(str(upload_path))
-    return upload_path.read_text(encoding="utf-8", errors="replace")
+    handler_name = _PRECONVERT_HANDLERS.get(ext)
+    if handler_name is not None:
+        return getattr(preconvert_module, handler_name)(str(upload_path))
+    return _read_utf8_text(upload_path)
@@ -11,6 +11,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+#: NLTK downloads mapped to the resource path ``nltk.data.find`` resolves.
+_NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+}
+
 
 def download_optional_models() -> None:
     """Download optional NLTK corpora and spaCy small models if installed.
@@ -28,8 +34,13 @@ def download_optional_models() -> None:
         logger.info("NLTK not installed; skipping corpus download.")
     else:  # pragma: no cover - download side effects
         try:
-            nltk.download("punkt", quiet=True)
-            nltk.download("averaged_perceptron_tagger", quiet=True)
+            for resource, path in _NLTK_RESOURCES.items():
+                # A local lookup is far cheaper than nltk.download, which
+                # fetches and parses the remote index even when up to date.
+                try:
+                    nltk.data.find(path)
+                except LookupError:
+                    nltk.download(resource, quiet=True)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Warning: Could not download NLTK data: %s", exc)
 
@@ -11,6 +11,9 @@ import re
 from collections.abc import Iterable
 
 _RE_BARE_URL = re.compile(r"(?<!<)(https?://\S+)(?!>)")
+_RE_SPLIT_URL = re.compile(r"https?://\S*(?:\n\S+)+")
+# A newline run containing a form feed, or any run of three or more newlines
+_RE_PAGE_BREAK = re.compile(r"[\n\x0c]*\x0c[\n\x0c]*|\n{3,}")
 
 
 def _trim_trailing_spaces(text: str) -> str:
@@ -32,21 +35,17 @@ def _join_split_urls(text: str) -> str:
     Returns:
         The input with URL internal newlines removed.
     """
-    # Merge newlines that fall inside a URL token: ...\n<non-space>
-    pattern = re.compile(r"(https?://\S*?)\n(\S)")
-    while True:
-        new = pattern.sub(r"\1\2", text)
-        if new == text:
-            return new
-        text = new
+    # A URL token followed by any number of ``\n<non-space>`` continuations is
+    # matched in one go, so a URL wrapped over many lines needs a single pass.
+    return _RE_SPLIT_URL.sub(_remove_newlines, text)
 
 
-def _wrap_bare_urls(text: str) -> str:
-    def _wrap(m: re.Match[str]) -> str:
-        url = m.group(1)
-        return f"<{url}>"
+def _remove_newlines(match: re.Match[str]) -> str:
+    return match.group(0).replace("\n", "")
+
 
-    return _RE_BARE_URL.sub(_wrap, text)
+def _wrap_bare_urls(text: str) -> str:
+    return _RE_BARE_URL.sub(r"<\1>", text)
 
 
 def _ensure_blank_line_before_lists(lines: Iterable[str]) -> list[str]:
@@ -108,11 +107,9 @@ def normalize_pdf_text(text: str, *, title: str | None) -> str:
     if not text:
         return text
 
-    # 1) Normalize page breaks
-    text = text.replace("\x0c", "\n\n")
-    # If there was already a newline before a form feed, the replacement may
-    # produce 3+ newlines; collapse to exactly one blank line separation.
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # 1) Normalize page breaks to a blank line and collapse runs of 3+ newlines
+    # (including those formed around a form feed) in the same pass.
+    text = _RE_PAGE_BREAK.sub("\n\n", text)
 
     # 2) Trim trailing spaces
     text = _trim_trailing_spaces(text)
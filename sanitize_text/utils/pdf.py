@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import re
+
+#: A line-final hyphen, the line break and the next line's indentation; the
+#: lookahead captures the next line's first character for the lowercase check.
+_RE_HYPHEN_BREAK = re.compile(r"-\n[^\S\n]*(?=(\S))")
+
 
 def normalize_text_for_pdf(text: str, mode: str) -> str:
     """Normalize text for better PDF rendering.
@@ -16,59 +22,44 @@ def normalize_text_for_pdf(text: str, mode: str) -> str:
     # Remove soft hyphen and non-breaking hyphen
     text = text.replace("\u00ad", "").replace("\u2011", "-")
 
-    # Work line by line
-    lines = text.splitlines()
+    # Normalize line separators and trim trailing whitespace per line
+    text = "\n".join([line.rstrip() for line in text.splitlines()])
 
     # First pass: join hyphenated line breaks (word-\nnext -> wordnext)
-    joined: list[str] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].rstrip()
-        if line.endswith("-") and i + 1 < len(lines):
-            nxt = lines[i + 1].lstrip()
-            # Avoid joining when the hyphen is likely meaningful (e.g., bullets)
-            if nxt and nxt[0].islower():
-                line = line[:-1] + nxt
-                i += 1
-            else:
-                joined.append(line)
-                i += 1
-                continue
-        joined.append(line)
-        i += 1
+    last_join = -1
+
+    def join_break(match: re.Match[str]) -> str:
+        nonlocal last_join
+        # Avoid joining when the hyphen is likely meaningful (e.g., bullets),
+        # and never chain onto a line that was itself just joined.
+        chained = last_join >= 0 and text.find("\n", last_join, match.start()) == -1
+        if chained or not match.group(1).islower():
+            return match.group(0)
+        last_join = match.end()
+        return ""
+
+    if "-\n" in text:
+        text = _RE_HYPHEN_BREAK.sub(join_break, text)
 
     if mode == "pre":
-        return "\n".join(joined)
+        return text
+    joined = text.split("\n")
 
-    # Paragraph mode: heuristically merge lines into paragraphs
+    # Paragraph mode: merge the lines of each blank-line separated block.
+    # Wrapped continuations and new sentences are both joined with a single
+    # space, so lines are collected as fragments and joined once per paragraph
+    # instead of being concatenated onto the previous line.
     paras: list[str] = []
     buf: list[str] = []
-
-    def flush() -> None:
-        if buf:
-            paras.append(" ".join(buf).strip())
-            buf.clear()
-
     for ln in joined:
-        if not ln.strip():
-            flush()
-            continue
-        if not buf:
-            buf.append(ln.strip())
-            continue
-        prev = buf[-1]
-        # If previous line ends with sentence punctuation, start a new sentence
-        if prev.endswith((".", "!", "?", ":")):
-            buf.append(ln.strip())
-        else:
-            # If next line starts lowercase/alphanumeric, consider it a wrapped
-            # continuation
-            first = ln.lstrip()[:1]
-            if first and (first.islower() or first.isdigit()):
-                buf[-1] = prev + " " + ln.strip()
-            else:
-                buf.append(ln.strip())
-    flush()
+        stripped = ln.strip()
+        if stripped:
+            buf.append(stripped)
+        elif buf:
+            paras.append(" ".join(buf))
+            buf.clear()
+    if buf:
+        paras.append(" ".join(buf))
 
     return "\n\n".join(paras)
 
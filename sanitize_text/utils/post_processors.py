@@ -8,6 +8,33 @@ import hashlib
 
 from scrubadub.post_processors import PostProcessor
 
+from sanitize_text.utils.filth import MarkdownUrlFilth
+
+#: Filth types whose placeholder prefix does not depend on the matched text.
+_URL_PLACEHOLDER_TYPES = {"url": "URL", "markdown_url": "URL"}
+
+
+def _placeholder_type_for(filth_type: str, text: str) -> str:
+    """Return the placeholder prefix for ``filth_type`` given its ``text``.
+
+    Returns:
+        ``"URL"`` for URL-like text, otherwise the upper-cased filth type.
+    """
+    # Use a consistent placeholder prefix: treat URL-like text as URL
+    lower_text = text.lower()
+    if lower_text.startswith(("http://", "https://", "ftp://", "www.")):
+        return "URL"
+    # Also catch obvious SharePoint fragments that start with the domain
+    if "sharepoint.com/" in lower_text:
+        return "URL"
+    # Markdown-style links such as "[text](<https://example.com>)" should
+    # also be treated as URL-like, even when produced by detectors that use
+    # the generic "unknown" filth type.
+    compact = lower_text.replace(" ", "")
+    if compact.startswith("[") and "](" in compact and "://" in compact:
+        return "URL"
+    return filth_type.upper()
+
 
 class HashedPIIReplacer(PostProcessor):
     """Post-processor that replaces PII with hashed identifiers.
@@ -31,9 +58,14 @@ class HashedPIIReplacer(PostProcessor):
             modulus: Bucket size for short IDs (increase to reduce collisions).
         """
         self.seen_values: dict[str, str] = {}
-        self.counter = 1
         self.algorithm = algorithm
         self.modulus = max(1, int(modulus))
+        # Zero-padded width of the short ID is fixed for the lifetime of the
+        # replacer, so the placeholder template is built once
+        self._id_width = max(3, len(str(self.modulus - 1)))
+        self._placeholder_template = f"%s-%0{self._id_width}d"
+        # Resolve the hash constructor once instead of branching per filth
+        self._hash_func = hashlib.sha256 if algorithm == "sha256" else hashlib.md5
 
     def process_filth(self, filth_list: list[object]) -> list[object]:
         """Process a list of filth and replace with hashed identifiers.
@@ -41,45 +73,32 @@ class HashedPIIReplacer(PostProcessor):
         Returns:
             The modified list with ``replacement_string`` set for each filth.
         """
-        from sanitize_text.utils.filth import MarkdownUrlFilth  # type: ignore
-
+        seen_values = self.seen_values
         for filth in filth_list:
             # Generate a unique identifier based on filth type and text
             key = f"{filth.type}:{filth.text}"
-            if key not in self.seen_values:
+            placeholder = seen_values.get(key)
+            if placeholder is None:
                 # Create a hash of the text for consistent replacement
-                if self.algorithm == "sha256":
-                    hash_obj = hashlib.sha256(key.encode())
-                else:
-                    hash_obj = hashlib.md5(key.encode())  # noqa: S303 - md5 acceptable here
-                # stable shortid
-                hash_val = int(hash_obj.hexdigest(), 16) % self.modulus
-                # Use a consistent placeholder prefix: treat URL-like text as URL
-                text = str(getattr(filth, "text", ""))
-                lower_text = text.lower()
-                is_urlish = lower_text.startswith(("http://", "https://", "ftp://", "www."))
-                # Also catch obvious SharePoint fragments that start with the domain
-                is_urlish = is_urlish or ("sharepoint.com/" in lower_text)
-                # Markdown-style links such as "[text](<https://example.com>)" should
-                # also be treated as URL-like, even when produced by detectors that use
-                # the generic "unknown" filth type.
-                if not is_urlish:
-                    compact = lower_text.replace(" ", "")
-                    if compact.startswith("[") and "](" in compact and "://" in compact:
-                        is_urlish = True
-                placeholder_type = (
-                    "URL" if filth.type in {"markdown_url"} or is_urlish else filth.type.upper()
-                )
-                width = max(3, len(str(self.modulus - 1)))
-                placeholder = f"{placeholder_type}-{hash_val:0{width}d}"
-                self.seen_values[key] = placeholder
-
-            placeholder = self.seen_values[key]
+                # Only a stable bucket is needed, not a security property; this
+                # also keeps md5 usable on FIPS-restricted OpenSSL builds.
+                hash_obj = self._hash_func(key.encode(), usedforsecurity=False)
+                # stable shortid (same value as int(hexdigest, 16), without the
+                # intermediate hex string)
+                hash_val = int.from_bytes(hash_obj.digest(), "big") % self.modulus
+                # URL filth always maps to the URL prefix, so only other types
+                # need the URL-like text checks in ``_placeholder_type_for``.
+                placeholder_type = _URL_PLACEHOLDER_TYPES.get(filth.type)
+                if placeholder_type is None:
+                    placeholder_type = _placeholder_type_for(filth.type, str(filth.text))
+                placeholder = self._placeholder_template % (placeholder_type, hash_val)
+                seen_values[key] = placeholder
 
             if isinstance(filth, MarkdownUrlFilth):
                 # Preserve Markdown structure, including single vs double brackets
-                brackets = "[" * getattr(filth, "bracket_pairs", 1)
-                closing = "]" * getattr(filth, "bracket_pairs", 1)
+                bracket_pairs = getattr(filth, "bracket_pairs", 1)
+                brackets = "[" * bracket_pairs
+                closing = "]" * bracket_pairs
                 filth.replacement_string = f"{brackets}{filth.link_text}{closing}({placeholder})"
             else:
                 filth.replacement_string = placeholder
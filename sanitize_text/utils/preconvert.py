@@ -13,8 +13,11 @@ import logging
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Any
 
-from markitdown import MarkItDown
+# Resolved on first use by ``to_markdown``: importing markitdown pulls in its
+# whole converter stack, which plain-text runs never need.
+MarkItDown: Any = None
 
 
 class ConversionError(Exception):
@@ -225,8 +228,11 @@ def to_markdown(path: str | Path) -> str:
     Raises:
         ConversionError: If markitdown fails to convert the file.
     """
+    global MarkItDown
     p = str(Path(path))
     try:
+        if MarkItDown is None:
+            from markitdown import MarkItDown
         with _suppress_fontbbox_logs():
             md = MarkItDown()
             result = md.convert(p)
@@ -102,6 +102,27 @@ def test_add_entity_duplicate_and_success(
     assert [e["match"] for e in data] == ["Amsterdam", "Breda"]
 
 
+def test_add_entity_inserts_in_order_and_sorts_hand_edited_files(tmp_path: Path) -> None:
+    """New entries land at their alphabetical slot; unsorted files are sorted first."""
+    cities = tmp_path / "cities.json"
+    initial = [
+        {"match": "Zwolle", "filth_type": "location"},
+        {"match": "amsterdam", "filth_type": "location"},
+        {"match": "Delft", "filth_type": "location"},
+    ]
+    cities.write_text(json.dumps(initial), encoding="utf-8")
+
+    mgr = EntityManager(stdout=lambda _msg: None, stderr=lambda _msg: None)
+    mgr.files["city"] = cities
+
+    assert mgr.add_entity("city", "AMSTERDAM") is False
+    assert mgr.add_entity("city", "Breda") is True
+    assert mgr.add_entity("city", "Utrecht") is True
+
+    data = json.loads(cities.read_text(encoding="utf-8"))
+    assert [e["match"] for e in data] == ["amsterdam", "Breda", "Delft", "Utrecht", "Zwolle"]
+
+
 def test_add_entity_save_failure_path(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """If save_json returns False, add_entity returns False without success message."""
     mgr = EntityManager()
@@ -30,6 +30,9 @@ def test_remove_unknown_placeholders() -> None:
     # Test multiple spaces are collapsed
     assert remove_unknown_placeholders("Hello <UNKNOWN-1>  world") == "Hello world"
 
+    # Space runs are tidied even when no placeholder is present
+    assert remove_unknown_placeholders("Plain  text\t\twith gaps") == "Plain text with gaps"
+
 
 def test_dedupe_adjacent_identical_lines() -> None:
     """Test removal of adjacent duplicate lines."""
@@ -117,6 +120,10 @@ def test_collapse_long_gibberish_in_brackets() -> None:
     assert "Normal text" in result_mixed
     assert "more text" in result_mixed
 
+    # Long runs outside any block are left alone
+    bare_run = "token " + "A" * 100 + " [short] (also short)"
+    assert collapse_long_gibberish_in_brackets(bare_run) == bare_run
+
 
 def test_collapse_exact_boundary_length() -> None:
     """Test that sequences exactly 80 chars are not collapsed."""
@@ -77,6 +77,19 @@ def test_read_input_source_append_reads_output(tmp_path: Path) -> None:
     assert got == "prev"
 
 
+def test_read_input_source_append_normalizes_crlf(tmp_path: Path) -> None:
+    """Append mode translates CRLF line endings like text-mode reads did."""
+    out = tmp_path / "out.txt"
+    out.write_bytes(b"line one\r\nline two\r\n")
+    got = cli_io.read_input_source(
+        text=None,
+        input_path=None,
+        append=True,
+        output_path=str(out),
+    )
+    assert got == "line one\nline two\n"
+
+
 def test_read_input_source_pdf(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     """PDF input is pre-converted to Markdown then normalized."""
     p = tmp_path / "in.pdf"
@@ -113,6 +126,23 @@ def test_read_input_source_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
     assert got == data
 
 
+def test_read_input_source_stdin_bytes_decoded_with_replacement(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Piped bytes are decoded as UTF-8 with invalid sequences replaced and CRLF translated."""
+
+    class FakeStdin:
+        buffer = io.BytesIO("Jan woont in Zürich\r\n".encode() + b"\xff")
+
+        def isatty(self) -> bool:
+            return False
+
+    monkeypatch.setattr("sys.stdin", FakeStdin())
+
+    got = cli_io.read_input_source(text=None, input_path=None, append=False, output_path=None)
+    assert got == "Jan woont in Zürich\n\ufffd"
+
+
 def test_write_output_txt(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Default to txt output in ./output when no path is provided."""
     # Ensure cwd for default output path
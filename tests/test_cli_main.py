@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+from types import SimpleNamespace
 from typing import Any
 
 from click import command, echo
@@ -155,14 +156,20 @@ def test_run_scrub_verbose_logs_and_collects(monkeypatch) -> None:
             self.texts = {"en_US": "EN"}
             self.errors = {}
             self.detectors = {"en_US": ["email", "url"]}
+            self.filth = {
+                "en_US": [
+                    SimpleNamespace(type="email", text="a@b.nl", replacement_string="EMAIL-01")
+                ]
+            }
 
-    monkeypatch.setattr(mod, "scrub_text", lambda *a, **k: DummyOutcome())
+    seen: dict[str, Any] = {}
+
+    def fake_scrub_text(*_a: Any, **k: Any) -> DummyOutcome:
+        seen.update(k)
+        return DummyOutcome()
+
+    monkeypatch.setattr(mod, "scrub_text", fake_scrub_text)
     monkeypatch.setattr(mod, "maybe_cleanup", lambda text, enabled: text)
-    monkeypatch.setattr(
-        importlib.import_module("sanitize_text.core.scrubber"),
-        "collect_filth",
-        lambda *a, **k: {"en_US": []},
-    )
 
     # Capture output via CliRunner by invoking a tiny wrapper command
     # to run _run_scrub in verbose mode and echo result.
@@ -185,6 +192,9 @@ def test_run_scrub_verbose_logs_and_collects(monkeypatch) -> None:
     assert "[Processing locale: en_US]" in result.output
     assert "EN" in result.output
     assert "Results for en_US:" not in result.output
+    # Filth is reused from the scrub pass rather than collected again
+    assert seen["include_filth"] is True
+    assert "  - email: 'a@b.nl' -> 'EMAIL-01'" in result.output
 
 
 def test_main_error_from_read_input_source(monkeypatch) -> None:
@@ -382,3 +392,40 @@ def test_main_passes_pdf_backend_to_read_input_source(monkeypatch, tmp_path) ->
     )
     assert result.exit_code == 0
     assert seen["pdf_backend"] == "markitdown"
+
+
+def test_main_spinner_only_for_large_input_on_a_terminal(monkeypatch) -> None:
+    """On a TTY the spinner starts at ``_SPINNER_MIN_CHARS`` characters, not below."""
+    mod = importlib.import_module("sanitize_text.cli.main")
+
+    starts: list[str] = []
+
+    class DummyHalo:
+        def __init__(self, *a: Any, **k: Any) -> None:  # noqa: D401
+            self.text = k.get("text", "")
+
+        def start(self) -> None:  # noqa: D401
+            starts.append(self.text)
+
+        def succeed(self, *_: Any, **__: Any) -> None:  # noqa: D401
+            return None
+
+    # CliRunner swaps sys.stdout for a non-TTY buffer, so fake a terminal via mod.sys.
+    fake_sys = SimpleNamespace(stdout=SimpleNamespace(isatty=lambda: True), exit=mod.sys.exit)
+    monkeypatch.setattr(mod, "sys", fake_sys)
+    monkeypatch.setattr(mod, "Halo", DummyHalo)
+    monkeypatch.setattr(mod, "_run_scrub", lambda **k: "SCRUB")
+
+    runner = CliRunner()
+
+    small = "x" * (mod._SPINNER_MIN_CHARS - 1)
+    monkeypatch.setattr(mod, "read_input_source", lambda **k: small)
+    result = runner.invoke(mod.main, ["-t", "foo"])
+    assert result.exit_code == 0
+    assert starts == []
+
+    large = "x" * mod._SPINNER_MIN_CHARS
+    monkeypatch.setattr(mod, "read_input_source", lambda **k: large)
+    result = runner.invoke(mod.main, ["-t", "foo"])
+    assert result.exit_code == 0
+    assert starts == ["Scrubbing PII"]
@@ -333,3 +333,197 @@ def test_build_spacy_detector_with_stub(monkeypatch):
     # Also cover the _spacy_enabled predicate
     monkeypatch.setattr(s, "_spacy_is_available", lambda: True, raising=True)
     assert s._spacy_enabled(ctx) is True
+
+
+def test_build_spacy_detector_reuses_loaded_model(monkeypatch):
+    """Repeated builds for the same locale share a single spaCy detector."""
+    import sys
+    from types import ModuleType
+
+    from sanitize_text.core import scrubber as s
+
+    mod = ModuleType("scrubadub_spacy.detectors")
+    loads: list[str] = []
+
+    class SpacyEntityDetector:  # noqa: D401 - simple stub
+        """Stub detector counting model loads."""
+
+        def __init__(self, *, model: str, name: str):
+            loads.append(model)
+            self.model = model
+            self.name = name
+
+    mod.SpacyEntityDetector = SpacyEntityDetector
+    monkeypatch.setitem(sys.modules, "scrubadub_spacy.detectors", mod)
+
+    ctx = s.DetectorContext(locale="nl_NL")
+    first = s._build_spacy_detector(ctx)
+    second = s._build_spacy_detector(ctx)
+    assert first is second
+    assert loads == ["nl_core_news_sm"]
+
+
+def test_replace_filth_matches_clean_output():
+    """_replace_filth splices replacement strings into the original text."""
+    from types import SimpleNamespace
+
+    from sanitize_text.core import scrubber as s
+
+    text = "Call John at 10.0.0.1 today"
+    filths = [
+        SimpleNamespace(beg=13, end=21, replacement_string="[IP-1]"),
+        SimpleNamespace(beg=5, end=9, replacement_string=None, replace_with=lambda: "{{NAME}}"),
+    ]
+    assert s._replace_filth(text, filths) == "Call {{NAME}} at [IP-1] today"
+    assert s._replace_filth(text, []) == text
+
+
+def test_scrub_text_processes_locales_in_order(monkeypatch):
+    """Locales are scrubbed one after another, in locale order."""
+    from sanitize_text.core import scrubber as s
+
+    events: list[str] = []
+
+    class FakeScrubber:
+        def __init__(self, locale: str):
+            self.locale = locale
+            self.detectors = {f"det_{locale}": object()}
+
+        def clean(self, text: str) -> str:
+            events.append(f"clean:{self.locale}")
+            return f"{text}|{self.locale}"
+
+    def setup(locale, selected_detectors, custom_text, verbose=False):  # noqa: ARG001
+        events.append(f"setup:{locale}")
+        return FakeScrubber(locale)
+
+    monkeypatch.setattr(s, "setup_scrubber", setup, raising=True)
+
+    outcome = s.scrub_text("hi")
+    assert events == ["setup:en_US", "clean:en_US", "setup:nl_NL", "clean:nl_NL"]
+    assert list(outcome.texts) == ["en_US", "nl_NL"]
+    assert outcome.texts["nl_NL"] == "hi|nl_NL"
+    assert outcome.detectors["en_US"] == ["det_en_US"]
+    assert outcome.errors == {}
+
+
+def test_scrub_text_include_filth_uses_single_detection_pass(monkeypatch):
+    """include_filth returns the filth found while producing the scrubbed text."""
+    from types import SimpleNamespace
+
+    from sanitize_text.core import scrubber as s
+
+    class FakeScrubber:
+        def __init__(self, locale: str):
+            self.locale = locale
+            self.detectors = {"name": object()}
+
+        def iter_filth(self, text: str):  # noqa: ARG002
+            return [SimpleNamespace(beg=0, end=4, replacement_string="NAME-01")]
+
+        def clean(self, text: str) -> str:  # pragma: no cover - must not be called
+            raise AssertionError("clean() would rescan the text")
+
+    def setup(locale, selected_detectors, custom_text, verbose=False):  # noqa: ARG001
+        return FakeScrubber(locale)
+
+    monkeypatch.setattr(s, "setup_scrubber", setup, raising=True)
+
+    outcome = s.scrub_text("John says hi", "en_US", include_filth=True)
+    assert outcome.texts == {"en_US": "NAME-01 says hi"}
+    assert outcome.filth is not None
+    assert [f.replacement_string for f in outcome.filth["en_US"]] == ["NAME-01"]
+
+
+def test_prune_spacy_pipeline_keeps_detector_pipes():
+    """Pipes the detector enables, and embeddings they listen to, stay enabled."""
+    from types import SimpleNamespace
+
+    from sanitize_text.core import scrubber as s
+
+    class FakeNlp:
+        def __init__(self) -> None:
+            self.pipes = {
+                "tok2vec": SimpleNamespace(listening_components=["tagger", "parser"]),
+                "tagger": SimpleNamespace(),
+                "parser": SimpleNamespace(),
+                "attribute_ruler": SimpleNamespace(),
+                "lemmatizer": SimpleNamespace(),
+                "ner": SimpleNamespace(),
+            }
+            self.disabled: list[str] = []
+
+        @property
+        def pipe_names(self) -> list[str]:
+            return [name for name in self.pipes if name not in self.disabled]
+
+        def get_pipe(self, name: str) -> object:
+            return self.pipes[name]
+
+        def disable_pipe(self, name: str) -> None:
+            self.disabled.append(name)
+
+    nlp = FakeNlp()
+    s._prune_spacy_pipeline(nlp)
+    assert nlp.pipe_names == ["tok2vec", "tagger", "parser", "ner"]
+    assert nlp.disabled == ["attribute_ruler", "lemmatizer"]
+
+    unused = FakeNlp()
+    unused.pipes["tok2vec"] = SimpleNamespace(listening_components=["textcat"])
+    s._prune_spacy_pipeline(unused)
+    assert unused.pipe_names == ["tagger", "parser", "ner"]
+
+
+def test_run_ner_only_selects_ner_per_detector_call():
+    """Each detection run enables only ner and restores the pipeline afterwards."""
+    from contextlib import contextmanager
+    from types import SimpleNamespace
+
+    from sanitize_text.core import scrubber as s
+
+    class FakeNlp:
+        def __init__(self) -> None:
+            self.pipes = {
+                "tok2vec": SimpleNamespace(listening_components=["tagger", "parser"]),
+                "tagger": SimpleNamespace(),
+                "parser": SimpleNamespace(),
+                "ner": SimpleNamespace(),
+            }
+            self.enabled = list(self.pipes)
+
+        @property
+        def pipe_names(self) -> list[str]:
+            return list(self.enabled)
+
+        def get_pipe(self, name: str) -> object:
+            return self.pipes[name]
+
+        @contextmanager
+        def select_pipes(self, enable: list[str]):
+            previous = self.enabled
+            self.enabled = [name for name in previous if name in enable]
+            try:
+                yield
+            finally:
+                self.enabled = previous
+
+    nlp = FakeNlp()
+    seen: list[list[str]] = []
+
+    class FakeDetector:
+        def iter_filth_documents(self, document_list, document_names):  # noqa: ARG002
+            seen.append(nlp.pipe_names)
+            yield from document_list
+
+    detector = FakeDetector()
+    s._run_ner_only(detector, nlp)
+
+    assert list(detector.iter_filth_documents(["a", "b"], ["0", "1"])) == ["a", "b"]
+    assert seen == [["ner"]]
+    assert nlp.pipe_names == ["tok2vec", "tagger", "parser", "ner"]
+
+    nlp.pipes["tok2vec"] = SimpleNamespace(listening_components=["tagger", "ner"])
+    listening = FakeDetector()
+    s._run_ner_only(listening, nlp)
+    list(listening.iter_filth_documents(["a"], ["0"]))
+    assert seen[-1] == ["tok2vec", "ner"]
@@ -332,3 +332,21 @@ def test_map_normalized_span_direct(monkeypatch: pytest.MonkeyPatch) -> None:
     # Pick a normalized span covering "B en C"
     start, end = d._map_normalized_span(text=text, norm_idx=3, norm_len=5)
     assert (start is None) is False and (end is None) is False and start < end
+
+
+def test_filter_overlapping_candidates_prefers_longer_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Longer spans win overlaps and the result comes back in text order."""
+    _install_stubs(monkeypatch)
+    base = _load_base_module()
+
+    candidates = [
+        (20, 24, "Bank"),
+        (0, 5, "Delft"),
+        (10, 24, "Rabobank Bank"),
+        (3, 8, "ft Ut"),
+        (30, 35, "Breda"),
+    ]
+    out = base.JSONEntityDetector._filter_overlapping_candidates(candidates)
+    assert out == [(0, 5, "Delft"), (10, 24, "Rabobank Bank"), (30, 35, "Breda")]
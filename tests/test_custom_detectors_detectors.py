@@ -28,6 +28,13 @@ def test_custom_word_detector_iter_filth_multiple() -> None:
     assert all(getattr(f, "text", None) == "Foo" for f in out)
 
 
+def test_custom_word_detector_reports_overlapping_occurrences() -> None:
+    """Overlapping occurrences are all yielded so their union covers the run."""
+    det = CustomWordDetector(custom_text="aa")
+    out = list(det.iter_filth("aaaaa"))
+    assert [(f.beg, f.end) for f in out] == [(0, 2), (1, 3), (2, 4), (3, 5)]
+
+
 def test_custom_word_detector_early_return() -> None:
     """No custom_text or empty text yields no filth (early returns)."""
     det1 = CustomWordDetector(custom_text=None)
@@ -53,6 +60,13 @@ def test_markdown_url_detector_variants_and_trim() -> None:
     assert len(items) == 2
 
 
+def test_markdown_url_detector_plain_text_short_circuit() -> None:
+    """Text without a Markdown link yields nothing and bare URLs are left alone."""
+    det = MarkdownUrlDetector()
+    det._verbose = True  # type: ignore[attr-defined]
+    assert list(det.iter_filth("See [notes] and (https://example.com) here.")) == []
+
+
 def test_url_detector_basic_and_sharepoint_heuristics() -> None:
     """BareDomainDetector matches common URL forms and skips sharepoint fragments."""
     det = BareDomainDetector()
@@ -104,3 +118,14 @@ def test_ip_detectors_private_and_public() -> None:
     pub_out = {f.text for f in pub.iter_filth(text)}
     assert {"192.168.1.1", "10.0.10.5", "172.20.1.2"}.issubset(priv_out)
     assert {"8.8.8.8", "9.9.9.9"}.issubset(pub_out)
+
+
+def test_ip_detectors_range_edges() -> None:
+    """Octet classification keeps the documented private/public boundaries."""
+    priv = PrivateIPDetector()
+    pub = PublicIPDetector()
+    text = "172.15.0.1 172.16.0.1 172.31.9.9 172.32.0.1 10.1.2.3 010.0.1.1 192.168.0.1.5"
+    priv_out = [f.text for f in priv.iter_filth(text)]
+    pub_out = [f.text for f in pub.iter_filth(text)]
+    assert priv_out == ["172.15.0.1", "172.16.0.1", "172.31.9.9", "172.32.0.1", "192.168.0.1"]
+    assert pub_out == ["172.15.0.1", "172.32.0.1", "10.1.2.3", "010.0.1.1", "168.0.1.5"]
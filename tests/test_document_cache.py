@@ -0,0 +1,48 @@
+"""Tests for :mod:`sanitize_text.utils.document_cache`."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from sanitize_text.utils.document_cache import DocumentCache, derived
+
+
+def test_document_cache_computes_once_per_document() -> None:
+    """Values are reused for the same document and dropped for a new one."""
+    calls: list[str] = []
+
+    def upper(text: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    cache = DocumentCache()
+    first = "jan woont in delft"
+    assert cache.get(first, "upper", upper) == "JAN WOONT IN DELFT"
+    assert cache.get(first, "upper", upper) == "JAN WOONT IN DELFT"
+    assert calls == [first]
+
+    second = "piet woont in breda"
+    assert cache.get(second, "upper", upper) == "PIET WOONT IN BREDA"
+    assert calls == [first, second]
+
+
+def test_derived_shares_cache_between_detectors_and_falls_back() -> None:
+    """Detectors sharing a cache compute once; detectors without one compute directly."""
+    calls: list[str] = []
+
+    def lower(text: str) -> str:
+        calls.append(text)
+        return text.lower()
+
+    cache = DocumentCache()
+    one = SimpleNamespace(_document_cache=cache)
+    two = SimpleNamespace(_document_cache=cache)
+    standalone = SimpleNamespace()
+    text = "Jan Jansen"
+
+    assert derived(one, text, "lower", lower) == "jan jansen"
+    assert derived(two, text, "lower", lower) == "jan jansen"
+    assert len(calls) == 1
+
+    assert derived(standalone, text, "lower", lower) == "jan jansen"
+    assert len(calls) == 2
@@ -0,0 +1,125 @@
+"""Tests for :mod:`sanitize_text.utils.io_helpers`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from sanitize_text.utils.io_helpers import read_file_to_text
+
+
+def _fake_preconvert(calls: list[tuple[str, str]]) -> SimpleNamespace:
+    def record(name: str):
+        def handler(path: str) -> str:
+            calls.append((name, Path(path).name))
+            return f"{name}:{Path(path).name}"
+
+        return handler
+
+    return SimpleNamespace(
+        docx_to_text=record("docx"),
+        rtf_to_text=record("rtf"),
+        image_to_text=record("image"),
+        to_markdown=record("markdown"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("filename", "handler"),
+    [
+        ("letter.DOCX", "docx"),
+        ("old.doc", "docx"),
+        ("notes.rtf", "rtf"),
+        ("scan.JPEG", "image"),
+        ("fax.tiff", "image"),
+    ],
+)
+def test_read_file_to_text_dispatches_on_extension(
+    tmp_path: Path, filename: str, handler: str
+) -> None:
+    """Known extensions are routed to the matching preconvert helper."""
+    calls: list[tuple[str, str]] = []
+    path = tmp_path / filename
+
+    out = read_file_to_text(
+        path,
+        preconvert_module=_fake_preconvert(calls),
+        normalize_pdf_text_func=lambda text, title=None: text,
+    )
+
+    assert out == f"{handler}:{filename}"
+    assert calls == [(handler, filename)]
+
+
+def test_read_file_to_text_falls_back_to_plain_text(tmp_path: Path) -> None:
+    """Unknown extensions are read as UTF-8 text without any conversion."""
+    calls: list[tuple[str, str]] = []
+    path = tmp_path / "input.log"
+    path.write_text("Jan woont in Delft", encoding="utf-8")
+
+    out = read_file_to_text(
+        path,
+        preconvert_module=_fake_preconvert(calls),
+        normalize_pdf_text_func=lambda text, title=None: text,
+    )
+
+    assert out == "Jan woont in Delft"
+    assert calls == []
+
+
+def test_read_file_to_text_replaces_invalid_utf8(tmp_path: Path) -> None:
+    """Undecodable bytes are replaced rather than raising."""
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"caf\xe9 open\n")
+
+    out = read_file_to_text(
+        path,
+        preconvert_module=_fake_preconvert([]),
+        normalize_pdf_text_func=lambda text, title=None: text,
+    )
+
+    assert out == "caf� open\n"
+
+
+def test_read_file_to_text_memory_maps_large_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files above the mmap threshold decode and translate newlines the same way."""
+    import sanitize_text.utils.io_helpers as io_helpers
+
+    monkeypatch.setattr(io_helpers, "_MMAP_THRESHOLD_BYTES", 4)
+    mapped: list[int] = []
+    real_mmap = io_helpers.mmap.mmap
+
+    def spy_mmap(fileno: int, length: int, **kwargs: object) -> object:
+        mapped.append(fileno)
+        return real_mmap(fileno, length, **kwargs)
+
+    monkeypatch.setattr(io_helpers.mmap, "mmap", spy_mmap)
+    path = tmp_path / "big.txt"
+    path.write_bytes("Jan woont in Delft \xe9\r\n".encode() + b"\xff")
+
+    out = read_file_to_text(
+        path,
+        preconvert_module=_fake_preconvert([]),
+        normalize_pdf_text_func=lambda text, title=None: text,
+    )
+
+    assert out == "Jan woont in Delft \xe9\n�"
+    assert len(mapped) == 1
+
+
+def test_read_file_to_text_normalizes_crlf(tmp_path: Path) -> None:
+    r"""Windows and old Mac line endings are translated to ``\n``."""
+    path = tmp_path / "windows.txt"
+    path.write_bytes(b"https://contoso.sharepoint.com/sites/\r\nteam\rend\r\n")
+
+    out = read_file_to_text(
+        path,
+        preconvert_module=_fake_preconvert([]),
+        normalize_pdf_text_func=lambda text, title=None: text,
+    )
+
+    assert out == "https://contoso.sharepoint.com/sites/\nteam\nend\n"
@@ -47,7 +47,14 @@ def test_download_optional_models__nltk_downloads(monkeypatch: pytest.MonkeyPatc
 
     calls: list[str] = []
 
+    class DummyData:
+        @staticmethod
+        def find(path: str) -> str:
+            raise LookupError(path)
+
     class DummyNltk:
+        data = DummyData()
+
         @staticmethod
         def download(name: str, quiet: bool = True) -> None:  # noqa: ARG002 - parity with real API
             calls.append(name)
@@ -64,6 +71,39 @@ def test_download_optional_models__nltk_downloads(monkeypatch: pytest.MonkeyPatc
     assert set(calls) == {"punkt", "averaged_perceptron_tagger"}
 
 
+def test_download_optional_models__nltk_skips_installed_resources(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Resources already found locally are not downloaded again."""
+    from sanitize_text.utils import nlp_resources
+
+    calls: list[str] = []
+
+    class DummyData:
+        @staticmethod
+        def find(path: str) -> str:
+            if path == "tokenizers/punkt":
+                return "/nltk_data/tokenizers/punkt"
+            raise LookupError(path)
+
+    class DummyNltk:
+        data = DummyData()
+
+        @staticmethod
+        def download(name: str, quiet: bool = True) -> None:  # noqa: ARG002 - parity with real API
+            calls.append(name)
+
+    monkeypatch.setitem(sys.modules, "nltk", DummyNltk())
+    monkeypatch.setattr(builtins, "__import__", _import_blocker({"spacy"}))
+
+    try:
+        nlp_resources.download_optional_models()
+    finally:
+        sys.modules.pop("nltk", None)
+
+    assert calls == ["averaged_perceptron_tagger"]
+
+
 def test_download_optional_models__spacy_models_already_available(
     caplog: pytest.LogCaptureFixture,
     monkeypatch: pytest.MonkeyPatch,
@@ -61,3 +61,18 @@ def test_normalize_list_spacing() -> None:
     out = normalize_pdf_text(src, title=None)
     # There should be a blank line between paragraph and list
     assert re.search(r"Paragraph\n\n- item 1", out) is not None
+
+
+def test_join_urls_wrapped_over_several_lines() -> None:
+    """A URL wrapped over many lines is rejoined up to the first blank or spaced line."""
+    src = "Go to https://example.com/a\nb/c\nd?x=1\n\nNext paragraph"
+    out = normalize_pdf_text(src, title=None)
+    assert "<https://example.com/ab/cd?x=1>" in out
+    assert out.endswith("\n\nNext paragraph")
+
+
+def test_form_feed_runs_collapse_to_single_blank_line() -> None:
+    """Form feeds and surrounding newline runs become exactly one blank line."""
+    src = "Page 1\n\x0c\n\x0cPage 2\n\n\n\nPage 3\n\nEnd"
+    out = normalize_pdf_text(src, title=None)
+    assert out == "Page 1\n\nPage 2\n\nPage 3\n\nEnd"
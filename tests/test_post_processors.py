@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
 from types import SimpleNamespace
 
@@ -30,6 +31,23 @@ def test_hashed_replacer_assigns_deterministic_placeholders() -> None:
     assert re.fullmatch(r"LOCATION-\d{4}", out[2].replacement_string)
 
 
+def test_hashed_replacer_placeholders_stable_across_instances() -> None:
+    """Placeholders derive from the digest, so separate runs agree."""
+
+    class FakeFilth:
+        def __init__(self, ftype: str, text: str) -> None:
+            self.type = ftype
+            self.text = text
+            self.replacement_string = ""
+
+    expected = int(hashlib.md5(b"name:John Doe").hexdigest(), 16) % 10000
+    first = HashedPIIReplacer().process_filth([FakeFilth("name", "John Doe")])
+    second = HashedPIIReplacer().process_filth([FakeFilth("name", "John Doe")])
+
+    assert first[0].replacement_string == f"NAME-{expected:04d}"
+    assert second[0].replacement_string == first[0].replacement_string
+
+
 def test_hashed_replacer_detects_urlish_text() -> None:
     """URL-like text should get URL placeholder type regardless of filth.type."""
     replacer = HashedPIIReplacer(modulus=1000)  # width 3
@@ -41,9 +59,11 @@ def test_hashed_replacer_detects_urlish_text() -> None:
             self.replacement_string = ""
 
     urlish = FakeFilth("name", "https://example.com/x")
-    out = replacer.process_filth([urlish])
+    bare = FakeFilth("url", "example.com")
+    out = replacer.process_filth([urlish, bare])
 
     assert re.fullmatch(r"URL-\d{3}", out[0].replacement_string)
+    assert re.fullmatch(r"URL-\d{3}", out[1].replacement_string)
 
 
 def test_markdown_url_filth_is_preserved_in_placeholder() -> None:
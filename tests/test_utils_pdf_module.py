@@ -14,6 +14,13 @@ def test_pre_mode_joins_hyphenated_linebreaks_and_trims() -> None:
     assert out.splitlines()[0].rstrip().endswith("world")
 
 
+def test_pre_mode_dehyphenation_rules() -> None:
+    """Only lowercase continuations join, one break per line, with lines trimmed."""
+    src = "co-\n  operate  \nlist-\n- item\nmulti-\nline-\nword"
+    out = normalize_text_for_pdf(src, mode="pre")
+    assert out.splitlines() == ["cooperate", "list-", "- item", "multiline-", "word"]
+
+
 def test_para_mode_merges_lines_and_paragraphs() -> None:
     """Para mode merges wrapped lines into sentences and paragraphs."""
     src = "Intro line.\ncontinues on next line\n\nAnother Para:\nmore text\n"